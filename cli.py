@@ -27,6 +27,12 @@ log = logging.getLogger(__name__)
 
 def parse_date(date_str: str) -> date:
     """Parse date string in various formats."""
+    # Fast path for the common ISO format
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        pass
+
     for fmt in ["%Y-%m-%d", "%Y%m%d", "%d/%m/%Y", "%d-%m-%Y"]:
         try:
             return datetime.strptime(date_str, fmt).date()
@@ -53,16 +59,21 @@ def cmd_extract(args):
     if args.output_dir:
         config.output_dir = Path(args.output_dir)
 
-    print(f"\n{'='*60}")
-    print(f"  ADS-B Flight Extractor")
-    print(f"{'='*60}")
-    print(f"  Callsign: {callsign}")
-    print(f"  Date: {target_date}")
+    banner = [
+        f"\n{'='*60}",
+        f"  ADS-B Flight Extractor",
+        f"{'='*60}",
+        f"  Callsign: {callsign}",
+        f"  Date: {target_date}",
+    ]
     if end_date:
-        print(f"  End Date: {end_date}")
-    print(f"  Log Dir: {config.log_dir}")
-    print(f"  Output Dir: {config.output_dir}")
-    print(f"{'='*60}\n")
+        banner.append(f"  End Date: {end_date}")
+    banner.extend([
+        f"  Log Dir: {config.log_dir}",
+        f"  Output Dir: {config.output_dir}",
+        f"{'='*60}\n",
+    ])
+    print("\n".join(banner))
 
     # Check if log directory exists
     if not config.log_dir.exists():
@@ -89,17 +100,20 @@ def cmd_extract(args):
         print(f"\nNo data found for {callsign} on {target_date}")
         return 1
 
-    print(f"\nFound {len(flight_data.records)} records")
-    print(f"  Duration: {flight_data.metadata.duration_minutes:.1f} minutes")
-    print(f"  Max Altitude: {flight_data.metadata.max_altitude_ft or 'N/A'} ft")
-    print(f"  Max Speed: {flight_data.metadata.max_ground_speed_kts or 'N/A'} kts")
-
-    if flight_data.metadata.crossover_detected:
-        print(f"  Midnight crossover detected!")
-        print(f"  Actual range: {flight_data.metadata.actual_start_date} to {flight_data.metadata.actual_end_date}")
-
     output_dir = flight_data.output_dir
-    print(f"\nOutput directory: {output_dir}")
+    found = [
+        f"\nFound {len(flight_data.records)} records",
+        f"  Duration: {flight_data.metadata.duration_minutes:.1f} minutes",
+        f"  Max Altitude: {flight_data.metadata.max_altitude_ft or 'N/A'} ft",
+        f"  Max Speed: {flight_data.metadata.max_ground_speed_kts or 'N/A'} kts",
+    ]
+    if flight_data.metadata.crossover_detected:
+        found.extend([
+            f"  Midnight crossover detected!",
+            f"  Actual range: {flight_data.metadata.actual_start_date} to {flight_data.metadata.actual_end_date}",
+        ])
+    found.append(f"\nOutput directory: {output_dir}")
+    print("\n".join(found))
 
     # Save metadata and summary
     print("\nSaving metadata...")
@@ -134,13 +148,17 @@ def cmd_extract(args):
         def chart_progress(current, total, name):
             print(f"  [{current}/{total}] {name}")
 
+        figures = {}
         results = generate_all_charts(
             records=flight_data.records,
             callsign=callsign,
             output_dir=output_dir,
             generate_png=not args.html_only,
             generate_html=not args.png_only,
-            progress_callback=chart_progress
+            progress_callback=chart_progress,
+            max_workers=args.jobs,
+            figure_cache=figures,
+            use_cache=args.reuse_charts
         )
 
         # Generate dashboard
@@ -155,15 +173,18 @@ def cmd_extract(args):
                 "duration_minutes": flight_data.metadata.duration_minutes,
                 "max_altitude_ft": flight_data.metadata.max_altitude_ft,
                 "records_extracted": flight_data.metadata.records_extracted,
-            }
+            },
+            prebuilt=figures
         )
         if dashboard_path:
             print(f"  Saved: {dashboard_path.name}")
 
-    print(f"\n{'='*60}")
-    print(f"  Extraction complete!")
-    print(f"  Output: {output_dir}")
-    print(f"{'='*60}\n")
+    print("\n".join([
+        f"\n{'='*60}",
+        f"  Extraction complete!",
+        f"  Output: {output_dir}",
+        f"{'='*60}\n",
+    ]))
 
     return 0
 
@@ -172,6 +193,7 @@ def cmd_list(args):
     """Handle the list command - show flights on a date."""
     from flight_extractor import FlightScanner, Config
     import fnmatch
+    import re
 
     target_date = parse_date(args.date)
 
@@ -188,28 +210,34 @@ def cmd_list(args):
 
     scanner = FlightScanner(config)
 
+    # Push the literal prefix of the pattern (e.g. "FDB" from "FDB*") down
+    # into the scanner so non-matching lines are skipped before parsing
+    pattern = args.pattern.upper() if args.pattern else None
+    prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0] if pattern else None
+
     print("Scanning files (this may take a moment)...")
-    callsigns = scanner.get_unique_callsigns(target_date)
+    callsigns = scanner.get_unique_callsigns(target_date, prefix=prefix)
 
     if not callsigns:
         print(f"No flights found on {target_date}")
         return 0
 
-    # Filter by pattern if specified
-    if args.pattern:
-        pattern = args.pattern.upper()
-        callsigns = {cs for cs in callsigns if fnmatch.fnmatch(cs.upper(), pattern)}
+    # Filter by pattern if specified (a plain "PREFIX*" is already applied)
+    if pattern and pattern != f"{prefix}*":
+        # Compile the glob once rather than re-resolving it per callsign
+        regex = re.compile(fnmatch.translate(pattern))
+        callsigns = {cs for cs in callsigns if regex.match(cs.upper())}
 
     # Sort and display
     sorted_callsigns = sorted(callsigns)
 
     print(f"\nFound {len(sorted_callsigns)} unique callsigns:\n")
 
-    # Display in columns
+    # Display in columns, emitted as a single write
     cols = 4
-    for i in range(0, len(sorted_callsigns), cols):
-        row = sorted_callsigns[i:i+cols]
-        print("  " + "  ".join(f"{cs:<12}" for cs in row))
+    cells = [f"{cs:<12}" for cs in sorted_callsigns]
+    rows = ["  " + "  ".join(cells[i:i+cols]) for i in range(0, len(cells), cols)]
+    sys.stdout.write("\n".join(rows) + "\n")
 
     print()
     return 0
@@ -255,6 +283,10 @@ Examples:
                                help="Only generate HTML charts (no PNG)")
     extract_parser.add_argument("--png-only", action="store_true",
                                help="Only generate PNG charts (no HTML)")
+    extract_parser.add_argument("--reuse-charts", action="store_true",
+                               help="Reuse charts from a previous extraction into the same folder")
+    extract_parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                               help="Render charts in N worker processes (default: 1, serial)")
 
     # List command
     list_parser = subparsers.add_parser("list",
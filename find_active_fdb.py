@@ -1,6 +1,14 @@
 #!/usr/bin/env python3
-"""Find currently active FDB flights."""
+"""Find currently active FDB flights.
+
+Usage:
+    python find_active_fdb.py             # reuse responses cached < 60s ago
+    python find_active_fdb.py --no-cache  # force a fresh API request
+"""
+import argparse
+import hashlib
 import json
+import time
 from urllib.request import Request, urlopen
 import sys
 from pathlib import Path
@@ -15,48 +23,79 @@ headers = {
     "User-Agent": "ADSB-Logger/1.0",
 }
 
+# FR24 live positions update roughly once a minute, so re-running the script
+# within that window can safely reuse the previous response.
+CACHE_DIR = Path.home() / ".cache" / "adsb-logger" / "fr24"
+CACHE_TTL_SECONDS = 60
+
+parser = argparse.ArgumentParser(description="Find currently active FDB flights")
+parser.add_argument("--no-cache", action="store_true",
+                    help="Ignore cached API responses and fetch fresh data")
+args = parser.parse_args()
+
+
+def fetch_json(url: str) -> dict:
+    """Fetch a FR24 API URL, using the on-disk response cache when fresh."""
+    cache_path = CACHE_DIR / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    if not args.no_cache:
+        try:
+            if time.time() - cache_path.stat().st_mtime < CACHE_TTL_SECONDS:
+                return json.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache entry - fetch fresh
+
+    req = Request(url, headers=headers)
+    with urlopen(req, timeout=10) as resp:
+        body = resp.read()
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(body)
+    except OSError:
+        pass  # Caching is best-effort
+
+    return json.loads(body)
+
+
 print("Searching for active Flydubai flights...")
 
 # Get all flights in UAE region
 url = "https://fr24api.flightradar24.com/api/live/flight-positions/full?bounds=24,26,54,56"
 
 try:
-    req = Request(url, headers=headers)
-    with urlopen(req, timeout=10) as resp:
-        data = json.loads(resp.read().decode("utf-8"))
-
-        if data.get("data"):
-            fdb_flights = []
-            for flight in data["data"]:
-                callsign = flight.get("identification", {}).get("callsign")
-                if callsign and callsign.startswith("FDB"):
-                    fdb_flights.append(flight)
-
-            if fdb_flights:
-                print(f"\nFound {len(fdb_flights)} active FDB flights:")
-                for f in fdb_flights[:5]:  # Show first 5
-                    cs = f.get("identification", {}).get("callsign")
-                    flight_id = f.get("id")
-                    origin = f.get("airport", {}).get("origin", {}).get("code", {}).get("iata")
-                    dest = f.get("airport", {}).get("destination", {}).get("code", {}).get("iata")
-                    route = f"{origin}-{dest}" if origin and dest else "N/A"
-                    print(f"  {cs}: ID={flight_id}, Route={route}")
-            else:
-                print("\n✗ No active FDB flights found in UAE region right now")
-                print("\nTrying to search for any FDB callsign pattern...")
-
-                # Try specific known FDB flights
-                test_callsigns = ["FDB1", "FDB10", "FDB100", "FDB2", "FDB20"]
-                for cs in test_callsigns:
-                    url2 = f"https://fr24api.flightradar24.com/api/live/flight-positions/full?callsigns={cs}"
-                    req2 = Request(url2, headers=headers)
-                    with urlopen(req2, timeout=10) as resp2:
-                        data2 = json.loads(resp2.read().decode("utf-8"))
-                        if data2.get("data"):
-                            print(f"  Found: {cs}")
-                            break
+    data = fetch_json(url)
+
+    if data.get("data"):
+        fdb_flights = []
+        for flight in data["data"]:
+            callsign = flight.get("identification", {}).get("callsign")
+            if callsign and callsign.startswith("FDB"):
+                fdb_flights.append(flight)
+
+        if fdb_flights:
+            print(f"\nFound {len(fdb_flights)} active FDB flights:")
+            for f in fdb_flights[:5]:  # Show first 5
+                cs = f.get("identification", {}).get("callsign")
+                flight_id = f.get("id")
+                origin = f.get("airport", {}).get("origin", {}).get("code", {}).get("iata")
+                dest = f.get("airport", {}).get("destination", {}).get("code", {}).get("iata")
+                route = f"{origin}-{dest}" if origin and dest else "N/A"
+                print(f"  {cs}: ID={flight_id}, Route={route}")
         else:
-            print("✗ No flights found")
+            print("\n✗ No active FDB flights found in UAE region right now")
+            print("\nTrying to search for any FDB callsign pattern...")
+
+            # Try specific known FDB flights
+            test_callsigns = ["FDB1", "FDB10", "FDB100", "FDB2", "FDB20"]
+            for cs in test_callsigns:
+                url2 = f"https://fr24api.flightradar24.com/api/live/flight-positions/full?callsigns={cs}"
+                data2 = fetch_json(url2)
+                if data2.get("data"):
+                    print(f"  Found: {cs}")
+                    break
+    else:
+        print("✗ No flights found")
 
 except Exception as e:
     print(f"✗ Error: {e}")
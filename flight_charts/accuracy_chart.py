@@ -1,7 +1,9 @@
 """Position accuracy chart (NIC/NAC quality indicators)."""
 import logging
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
+import numpy as np
 
 from .base import BaseChart, HAS_MATPLOTLIB, HAS_PLOTLY
 
@@ -25,6 +27,16 @@ class AccuracyChart(BaseChart):
     - SIL (Surveillance Integrity Level)
     """
 
+    REQUIRED_ANY_COLS = ("nic", "nac_p", "nac_v", "sil")
+
+    # (column, label, color) for each plotted indicator
+    METRICS = (
+        ("nic", "NIC", "blue"),
+        ("nac_p", "NAC_p", "green"),
+        ("nac_v", "NAC_v", "red"),
+        ("sil", "SIL", "purple"),
+    )
+
     @property
     def name(self) -> str:
         return "position_accuracy"
@@ -33,8 +45,14 @@ class AccuracyChart(BaseChart):
     def title(self) -> str:
         return f"{self.callsign} - Position Accuracy (NIC/NAC)"
 
+    @cached_property
+    def _available_metrics(self) -> list:
+        """METRICS entries whose column has data, shared by both backends."""
+        return [(col, label, color) for col, label, color in self.METRICS
+                if self._has_column(col)]
+
     def _create_matplotlib_figure(self) -> Optional['plt.Figure']:
-        if not HAS_MATPLOTLIB or self.df is None:
+        if not HAS_MATPLOTLIB or self.df is None or self.df.empty:
             return None
 
         df = self.df
@@ -42,23 +60,13 @@ class AccuracyChart(BaseChart):
         if "datetime" not in df.columns:
             return None
 
-        has_nic = "nic" in df.columns and df["nic"].notna().any()
-        has_nac_p = "nac_p" in df.columns and df["nac_p"].notna().any()
-        has_nac_v = "nac_v" in df.columns and df["nac_v"].notna().any()
-        has_sil = "sil" in df.columns and df["sil"].notna().any()
-
-        metrics = [(has_nic, "nic", "NIC", "blue"),
-                   (has_nac_p, "nac_p", "NAC_p", "green"),
-                   (has_nac_v, "nac_v", "NAC_v", "red"),
-                   (has_sil, "sil", "SIL", "purple")]
-
-        available = [(col, label, color) for has, col, label, color in metrics if has]
+        available = self._available_metrics
 
         if not available:
             log.warning("No accuracy data for chart")
             return None
 
-        fig, ax = plt.subplots(1, 1, figsize=(12, 5))
+        fig, ax = plt.subplots(1, 1, figsize=(12, 5), constrained_layout=True)
 
         for col, label, color in available:
             ax.plot(df["datetime"], df[col], "-", linewidth=1.5,
@@ -80,11 +88,10 @@ class AccuracyChart(BaseChart):
         ax.axhspan(0, 4, alpha=0.1, color="red")
 
         self._format_time_axis(ax)
-        plt.tight_layout()
         return fig
 
     def _create_plotly_figure(self) -> Optional['go.Figure']:
-        if not HAS_PLOTLY or self.df is None:
+        if not HAS_PLOTLY or self.df is None or self.df.empty:
             return None
 
         df = self.df
@@ -92,17 +99,7 @@ class AccuracyChart(BaseChart):
         if "datetime" not in df.columns:
             return None
 
-        has_nic = "nic" in df.columns and df["nic"].notna().any()
-        has_nac_p = "nac_p" in df.columns and df["nac_p"].notna().any()
-        has_nac_v = "nac_v" in df.columns and df["nac_v"].notna().any()
-        has_sil = "sil" in df.columns and df["sil"].notna().any()
-
-        metrics = [(has_nic, "nic", "NIC", "blue"),
-                   (has_nac_p, "nac_p", "NAC_p", "green"),
-                   (has_nac_v, "nac_v", "NAC_v", "red"),
-                   (has_sil, "sil", "SIL", "purple")]
-
-        available = [(col, label, color) for has, col, label, color in metrics if has]
+        available = self._available_metrics
 
         if not available:
             return None
@@ -147,13 +144,19 @@ class AccuracyChart(BaseChart):
 
         summary = {}
 
-        for col in ["nic", "nac_p", "nac_v", "sil"]:
-            if col in self.df.columns and self.df[col].notna().any():
-                summary[col] = {
-                    "min": int(self.df[col].min()),
-                    "max": int(self.df[col].max()),
-                    "mean": round(self.df[col].mean(), 1),
-                    "mode": int(self.df[col].mode().iloc[0]) if len(self.df[col].mode()) > 0 else None,
-                }
+        for col, _, _ in self._available_metrics:
+            values = self.df[col].dropna().to_numpy(dtype=float)
+            lo = int(values.min())
+
+            # Indicators are small integers, so a bincount gives the mode
+            # in a single pass (ties resolve to the lowest value)
+            counts = np.bincount(values.astype(np.int64) - lo)
+
+            summary[col] = {
+                "min": lo,
+                "max": int(values.max()),
+                "mean": round(float(values.mean()), 1),
+                "mode": int(counts.argmax()) + lo,
+            }
 
         return summary
@@ -2,6 +2,7 @@
 import logging
 from pathlib import Path
 from typing import Optional
+import numpy as np
 
 from .base import BaseChart, HAS_MATPLOTLIB, HAS_PLOTLY, HAS_PANDAS
 
@@ -24,6 +25,8 @@ class AltitudeChart(BaseChart):
     - Climb/descent phase coloring
     """
 
+    REQUIRED_ANY_COLS = ("alt_baro", "alt_geom")
+
     @property
     def name(self) -> str:
         return "altitude_profile"
@@ -33,7 +36,7 @@ class AltitudeChart(BaseChart):
         return f"{self.callsign} - Altitude Profile"
 
     def _create_matplotlib_figure(self) -> Optional['plt.Figure']:
-        if not HAS_MATPLOTLIB or self.df is None:
+        if not HAS_MATPLOTLIB or self.df is None or self.df.empty:
             return None
 
         df = self.df
@@ -43,9 +46,9 @@ class AltitudeChart(BaseChart):
             log.warning("No datetime column for altitude chart")
             return None
 
-        has_alt_baro = "alt_baro" in df.columns and df["alt_baro"].notna().any()
-        has_alt_geom = "alt_geom" in df.columns and df["alt_geom"].notna().any()
-        has_vrate = "baro_rate" in df.columns and df["baro_rate"].notna().any()
+        has_alt_baro = self._has_column("alt_baro")
+        has_alt_geom = self._has_column("alt_geom")
+        has_vrate = self._has_column("baro_rate")
 
         if not has_alt_baro and not has_alt_geom:
             log.warning("No altitude data for chart")
@@ -54,17 +57,18 @@ class AltitudeChart(BaseChart):
         # Create figure with subplots
         if has_vrate:
             fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True,
-                                            gridspec_kw={"height_ratios": [3, 1]})
+                                            gridspec_kw={"height_ratios": [3, 1]},
+                                            constrained_layout=True)
         else:
-            fig, ax1 = plt.subplots(1, 1, figsize=(12, 5))
+            fig, ax1 = plt.subplots(1, 1, figsize=(12, 5), constrained_layout=True)
             ax2 = None
 
         # Plot altitudes
         if has_alt_baro:
-            ax1.plot(df["datetime"], df["alt_baro"], "b-", linewidth=1.5,
+            ax1.plot(*self._trace("alt_baro"), "b-", linewidth=1.5,
                     label="Baro Altitude", alpha=0.9)
         if has_alt_geom:
-            ax1.plot(df["datetime"], df["alt_geom"], "g--", linewidth=1,
+            ax1.plot(*self._trace("alt_geom"), "g--", linewidth=1,
                     label="Geom Altitude", alpha=0.7)
 
         ax1.set_ylabel("Altitude (ft)")
@@ -77,10 +81,10 @@ class AltitudeChart(BaseChart):
 
         # Plot vertical rate
         if ax2 is not None and has_vrate:
-            vrate = df["baro_rate"].fillna(0)
-            ax2.fill_between(df["datetime"], 0, vrate,
+            times, vrate = self._trace("baro_rate", fill=0.0)
+            ax2.fill_between(times, 0, vrate,
                            where=vrate > 0, color="green", alpha=0.5, label="Climb")
-            ax2.fill_between(df["datetime"], 0, vrate,
+            ax2.fill_between(times, 0, vrate,
                            where=vrate < 0, color="red", alpha=0.5, label="Descent")
             ax2.axhline(y=0, color="gray", linestyle="-", linewidth=0.5)
             ax2.set_ylabel("Vertical Rate (ft/min)")
@@ -95,11 +99,10 @@ class AltitudeChart(BaseChart):
             self._format_time_axis(ax1)
             ax1.set_xlabel("Time (UTC)")
 
-        plt.tight_layout()
         return fig
 
     def _create_plotly_figure(self) -> Optional['go.Figure']:
-        if not HAS_PLOTLY or self.df is None:
+        if not HAS_PLOTLY or self.df is None or self.df.empty:
             return None
 
         df = self.df
@@ -107,9 +110,9 @@ class AltitudeChart(BaseChart):
         if "datetime" not in df.columns:
             return None
 
-        has_alt_baro = "alt_baro" in df.columns and df["alt_baro"].notna().any()
-        has_alt_geom = "alt_geom" in df.columns and df["alt_geom"].notna().any()
-        has_vrate = "baro_rate" in df.columns and df["baro_rate"].notna().any()
+        has_alt_baro = self._has_column("alt_baro")
+        has_alt_geom = self._has_column("alt_geom")
+        has_vrate = self._has_column("baro_rate")
 
         if not has_alt_baro and not has_alt_geom:
             return None
@@ -128,10 +131,11 @@ class AltitudeChart(BaseChart):
 
         # Altitude traces
         if has_alt_baro:
+            times, alt_baro = self._trace("alt_baro")
             fig.add_trace(
                 go.Scatter(
-                    x=df["datetime"],
-                    y=df["alt_baro"],
+                    x=times,
+                    y=alt_baro,
                     name="Baro Altitude",
                     line=dict(color="blue", width=2),
                     hovertemplate="<b>%{y:.0f} ft</b><br>%{x}<extra></extra>"
@@ -140,10 +144,11 @@ class AltitudeChart(BaseChart):
             )
 
         if has_alt_geom:
+            times, alt_geom = self._trace("alt_geom")
             fig.add_trace(
                 go.Scatter(
-                    x=df["datetime"],
-                    y=df["alt_geom"],
+                    x=times,
+                    y=alt_geom,
                     name="Geom Altitude",
                     line=dict(color="green", width=1, dash="dash"),
                     opacity=0.7,
@@ -154,13 +159,15 @@ class AltitudeChart(BaseChart):
 
         # Vertical rate
         if has_vrate:
-            vrate = df["baro_rate"].fillna(0)
+            times, vrate = self._trace("baro_rate", fill=0.0)
+            climb = np.where(vrate > 0, vrate, 0.0)
+            descent = np.where(vrate < 0, vrate, 0.0)
 
             # Positive (climb)
             fig.add_trace(
                 go.Scatter(
-                    x=df["datetime"],
-                    y=vrate.where(vrate > 0, 0),
+                    x=times,
+                    y=climb,
                     name="Climb",
                     fill="tozeroy",
                     fillcolor="rgba(0, 255, 0, 0.3)",
@@ -173,8 +180,8 @@ class AltitudeChart(BaseChart):
             # Negative (descent)
             fig.add_trace(
                 go.Scatter(
-                    x=df["datetime"],
-                    y=vrate.where(vrate < 0, 0),
+                    x=times,
+                    y=descent,
                     name="Descent",
                     fill="tozeroy",
                     fillcolor="rgba(255, 0, 0, 0.3)",
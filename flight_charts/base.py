@@ -1,14 +1,23 @@
 """Base chart class and utilities for flight visualization."""
+import hashlib
+import html
+import importlib.util
 import logging
+import os
+import shutil
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache, wraps
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Tuple
+from string import Template
+from typing import Dict, List, Optional, Tuple
 
 log = logging.getLogger(__name__)
 
 # Check for optional dependencies
 try:
+    import numpy as np
     import pandas as pd
     HAS_PANDAS = True
 except ImportError:
@@ -25,16 +34,131 @@ except ImportError:
 
 try:
     import plotly.graph_objects as go
+    import plotly.io as pio
+    from plotly.offline import get_plotlyjs_version
     from plotly.subplots import make_subplots
+    # One shared template for every chart, resolved once here instead of per figure
+    pio.templates.default = "plotly_white"
     HAS_PLOTLY = True
 except ImportError:
     HAS_PLOTLY = False
 
+# numba is slow to import, so only check that it is installed; kernels
+# import and compile it on first use (see lazy_njit)
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Below this many points the numpy path is faster than loading numba and
+# fetching (or compiling) a kernel, so kernels are only used above it
+NUMBA_MIN_POINTS = 100_000
+
+
+# Columns coerced to float64 by prepare_dataframe (unparseable values -> NaN)
+NUMERIC_COLUMNS = frozenset([
+    "lat", "lon", "alt_baro", "alt_geom",
+    "gs", "ias", "tas", "mach",
+    "baro_rate", "geom_rate",
+    "track", "true_heading", "mag_heading",
+    "rssi", "messages",
+    "nic", "nac_p", "nac_v", "sil", "gva", "sda",
+    "wd", "ws", "oat", "tat",
+])
+
+# Altitude columns where readsb reports "ground" instead of a number
+ALTITUDE_COLUMNS = frozenset(["alt_baro", "alt_geom"])
+
+# Standalone chart page; the figure JSON is embedded as-is and drawn from the CDN
+_CHART_HTML = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>$title</title>
+    <script src="$plotlyjs_src"></script>
+    <style>html, body {height: 100%; margin: 0;}</style>
+</head>
+<body>
+    <div id="chart" class="plotly-graph-div" style="height:100%; width:100%;"></div>
+    <script>
+        var fig = $fig_json;
+        Plotly.newPlot("chart", fig.data, fig.layout, {"responsive": true});
+    </script>
+</body>
+</html>
+""")
+
+# Per-flight-directory store of chart outputs (see generate_all_charts(use_cache=...))
+CHART_CACHE_DIRNAME = ".chart_cache"
+
+# Records sampled (evenly strided) into the chart cache key, and the fields
+# read from each; enough to notice re-extracted or edited data cheaply
+CACHE_KEY_SAMPLES = 256
+CACHE_KEY_FIELDS = ("_ts", "alt_baro", "lat", "lon", "gs", "baro_rate", "track")
+
+# Applied while saving PNGs: merge line segments that deviate by less than
+# one pixel, which cuts draw time on dense traces without a visible change
+MATPLOTLIB_RENDER_PARAMS = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+}
+
+# Points kept per time-series trace after min/max downsampling
+DOWNSAMPLE_POINTS = 2000
+
+# Plotted values need no more than ~7 significant digits; float32 halves the
+# arrays handed to matplotlib/plotly and the typed-array payload in the HTML
+PLOT_DTYPE = "float32"
+
+
+def lazy_njit(**options):
+    """
+    Decorator that compiles a function with numba.njit(**options) on its first call.
+
+    numba is imported only then, so importing the chart modules stays cheap.
+    Callers check HAS_NUMBA and NUMBA_MIN_POINTS before using the decorated
+    function; pass cache=True so the compiled kernel is reused across runs.
+    """
+    def decorate(func):
+        compiled = None
+
+        @wraps(func)
+        def wrapper(*args):
+            nonlocal compiled
+            if compiled is None:
+                from numba import njit
+                compiled = njit(**options)(func)
+            return compiled(*args)
+
+        return wrapper
+
+    return decorate
+
+
+def _numeric_column(values: list, is_altitude: bool) -> 'np.ndarray':
+    """Convert a column of raw values to float64, mapping "ground" to 0 for altitudes."""
+    # Fast path: all numbers (None becomes NaN)
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+
+    out = np.empty(len(values), dtype=np.float64)
+    for i, value in enumerate(values):
+        if is_altitude and value == "ground":
+            out[i] = 0.0
+            continue
+        try:
+            out[i] = float(value) if value is not None else np.nan
+        except (TypeError, ValueError):
+            out[i] = np.nan
+    return out
+
 
 def prepare_dataframe(records: List[dict]) -> 'pd.DataFrame':
     """
     Convert records to pandas DataFrame with proper types.
 
+    Builds the frame column by column (one array per field) rather than
+    letting pandas transpose the list of dicts.
+
     Args:
         records: List of flight data records
 
@@ -44,46 +168,137 @@ def prepare_dataframe(records: List[dict]) -> 'pd.DataFrame':
     if not HAS_PANDAS:
         raise ImportError("pandas is required for chart generation")
 
-    df = pd.DataFrame(records)
+    # Columns in order of first appearance, as pd.DataFrame(records) would give
+    columns = dict.fromkeys(chain.from_iterable(records))
+
+    data = {}
+    for col in columns:
+        values = [record.get(col) for record in records]
+        if col in NUMERIC_COLUMNS:
+            data[col] = _numeric_column(values, col in ALTITUDE_COLUMNS)
+        else:
+            data[col] = values
+
+    df = pd.DataFrame(data, copy=False)
 
     # Convert timestamp to datetime
     if "_ts" in df.columns:
         df["datetime"] = pd.to_datetime(df["_ts"], unit="s", utc=True)
 
-    # Ensure numeric columns are numeric
-    numeric_cols = [
-        "lat", "lon", "alt_baro", "alt_geom",
-        "gs", "ias", "tas", "mach",
-        "baro_rate", "geom_rate",
-        "track", "true_heading", "mag_heading",
-        "rssi", "messages",
-        "nic", "nac_p", "nac_v", "sil", "gva", "sda",
-        "wd", "ws", "oat", "tat",
-    ]
-
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    # Handle "ground" altitude values
-    for alt_col in ["alt_baro", "alt_geom"]:
-        if alt_col in df.columns:
-            df[alt_col] = df[alt_col].replace("ground", 0)
-            df[alt_col] = pd.to_numeric(df[alt_col], errors="coerce")
-
     return df
 
 
+def decimate_dataframe(df: 'pd.DataFrame', max_points: int) -> 'pd.DataFrame':
+    """Reduce a DataFrame to max_points rows sampled uniformly, keeping both ends."""
+    if len(df) <= max_points:
+        return df
+
+    idx = np.linspace(0, len(df) - 1, max_points, dtype=np.int64)
+    decimated = df.take(idx)
+    log.info(f"Decimated data from {len(df)} to {len(decimated)} points")
+    return decimated
+
+
+def plotlyjs_cdn_url() -> str:
+    """CDN URL of the plotly.js build matching the installed plotly package."""
+    return f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+
+def minmax_downsample_indices(y: 'np.ndarray', n_out: int) -> 'np.ndarray':
+    """
+    Pick indices that keep the shape of a trace: the min and max of each of
+    n_out // 2 equal-width buckets, plus both ends.
+
+    NaN gaps survive: an all-NaN bucket contributes its first (NaN) point.
+
+    Args:
+        y: Trace values
+        n_out: Approximate number of points to keep
+
+    Returns:
+        Sorted unique indices into y
+    """
+    n = len(y)
+    size = -(-n // max(n_out // 2, 1))
+    n_bins = -(-n // size)
+
+    rows = np.full(n_bins * size, np.nan)
+    rows[:n] = y
+    rows = rows.reshape(n_bins, size)
+    missing = np.isnan(rows)
+
+    offsets = np.arange(n_bins) * size
+    lo = np.where(missing, np.inf, rows).argmin(axis=1) + offsets
+    hi = np.where(missing, -np.inf, rows).argmax(axis=1) + offsets
+
+    idx = np.unique(np.concatenate([[0, n - 1], lo, hi]))
+    return idx[idx < n]
+
+
+@lru_cache(maxsize=None)
+def chart_cache_version() -> str:
+    """Digest of the chart module sources, so any rendering change invalidates the cache."""
+    h = hashlib.sha1()
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        h.update(source.name.encode())
+        h.update(source.read_bytes())
+    return h.hexdigest()[:12]
+
+
+def records_cache_key(records: List[dict], callsign: str, max_points: int) -> str:
+    """
+    Build a key for the on-disk chart cache from the flight's identity.
+
+    Uses the callsign, record count and a digest of a strided sample of
+    records (timestamps, altitude, position, speed) rather than hashing every
+    record, so computing it stays cheap on a cold run while still changing
+    when the flight data does.
+
+    Args:
+        records: Flight data records
+        callsign: Flight callsign (appears in chart titles)
+        max_points: Max points before decimation
+
+    Returns:
+        Hex digest identifying this chart input
+    """
+    digest = hashlib.sha1(
+        f"{chart_cache_version()}:{callsign}:{max_points}:{len(records)}".encode()
+    )
+    step = max(1, len(records) // CACHE_KEY_SAMPLES)
+    # Always include the last record so trailing edits change the key
+    sample = records[::step]
+    if records and (len(records) - 1) % step:
+        sample = [*sample, records[-1]]
+    for record in sample:
+        digest.update(repr(tuple(record.get(f) for f in CACHE_KEY_FIELDS)).encode())
+    return digest.hexdigest()
+
+
+def _link_or_copy(source: Path, dest: Path):
+    """Hard-link source to dest (replacing dest), copying where links are unsupported."""
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
+
+
 class BaseChart(ABC):
     """Abstract base class for all chart types."""
 
+    # Chart is skipped unless the data has at least one of these columns
+    REQUIRED_ANY_COLS: Tuple[str, ...] = ()
+
     def __init__(
         self,
         records: List[dict],
         callsign: str,
         output_dir: Optional[Path] = None,
         dpi: int = 150,
-        max_points: int = 10000
+        max_points: int = 10000,
+        df: Optional['pd.DataFrame'] = None,
+        cache_key: Optional[str] = None
     ):
         """
         Initialize chart generator.
@@ -94,6 +309,10 @@ class BaseChart(ABC):
             output_dir: Directory for output files
             dpi: DPI for PNG output
             max_points: Max points before decimation
+            df: Already prepared (and decimated) DataFrame to share between
+                charts; built from records when omitted. Treated as read-only.
+            cache_key: records_cache_key() of the input, to reuse outputs from
+                output_dir/.chart_cache; outputs are not cached when omitted
         """
         self.records = records
         self.callsign = callsign
@@ -102,16 +321,22 @@ class BaseChart(ABC):
         self.max_points = max_points
 
         # Prepare DataFrame
-        if HAS_PANDAS:
-            self.df = prepare_dataframe(records)
-            # Decimate if needed
-            if len(self.df) > max_points:
-                step = len(self.df) // max_points
-                self.df = self.df.iloc[::step].copy()
-                log.info(f"Decimated data from {len(records)} to {len(self.df)} points")
+        if df is not None:
+            self.df = df
+        elif HAS_PANDAS:
+            self.df = decimate_dataframe(prepare_dataframe(records), max_points)
         else:
             self.df = None
 
+        # Last figure built by generate_plotly(), kept for reuse (e.g. dashboard)
+        self.plotly_figure: Optional['go.Figure'] = None
+        self._plotly_json: Optional[str] = None
+
+        # Per-column plot arrays, shared by both backends (see _trace)
+        self._traces: Dict[Tuple[str, Optional[float]], tuple] = {}
+
+        self._cache_key = cache_key
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -124,6 +349,102 @@ class BaseChart(ABC):
         """Chart title for display."""
         pass
 
+    @cached_property
+    def _available_cols(self) -> frozenset:
+        """Columns with at least one non-null value, probed once per chart."""
+        df = self.df
+        if df is None or df.empty:
+            return frozenset()
+
+        # Most columns are filled in the first record; only scan the others
+        in_first_row = df.iloc[0].notna().to_numpy()
+        present = set(df.columns[in_first_row])
+        rest = df.columns[~in_first_row]
+        if len(rest):
+            present.update(rest[df[rest].notna().any().to_numpy()])
+        return frozenset(present)
+
+    def _has_column(self, col: str) -> bool:
+        """Check whether a column exists and has at least one non-null value."""
+        return col in self._available_cols
+
+    def _cache_path(self, suffix: str) -> Optional[Path]:
+        """Path of this chart's cached output with the given suffix, if caching."""
+        if self.output_dir is None or self._cache_key is None:
+            return None
+        return self.output_dir / CHART_CACHE_DIRNAME / f"{self._cache_key}.{self.name}{suffix}"
+
+    def _prepare_cache_entry(self, cached: Path):
+        """
+        Make room for a new cache entry.
+
+        Entries for the same chart and suffix under other keys are removed,
+        so the cache holds at most one generation of each output.
+        """
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        suffix = cached.name[len(self._cache_key):]
+        for stale in cached.parent.glob(f"*{suffix}"):
+            if stale != cached:
+                stale.unlink()
+
+    def _store_cache(self, source: Path, cached: Optional[Path]):
+        """Link a freshly generated output into the chart cache."""
+        if cached is None:
+            return
+        try:
+            self._prepare_cache_entry(cached)
+            _link_or_copy(source, cached)
+        except OSError as e:
+            log.debug(f"Could not cache {source.name}: {e}")
+
+    def plotly_json(self) -> Optional[str]:
+        """Plotly JSON of the figure from the last generate_plotly() call."""
+        if self._plotly_json is None and self.plotly_figure is not None:
+            self._plotly_json = pio.to_json(self.plotly_figure, validate=False, pretty=False)
+        return self._plotly_json
+
+    @cached_property
+    def _times(self) -> 'np.ndarray':
+        """The datetime column as a datetime64[ns] (UTC) array, extracted once."""
+        return self.df["datetime"].to_numpy(dtype="datetime64[ns]")
+
+    def _trace(self, col: str, fill: Optional[float] = None):
+        """
+        Downsampled (times, values) arrays for one numeric column.
+
+        Memoized so the matplotlib and plotly figures share the extraction.
+
+        Args:
+            col: Column name
+            fill: Value to replace NaNs with before downsampling, if any
+        """
+        key = (col, fill)
+        if key not in self._traces:
+            values = self.df[col].to_numpy(dtype=float)
+            if fill is not None:
+                values = np.nan_to_num(values, nan=fill)
+            self._traces[key] = self._downsample(self._times, values)
+        return self._traces[key]
+
+    def _downsample(self, x, y, n_out: int = DOWNSAMPLE_POINTS):
+        """
+        Min/max downsample one trace before plotting.
+
+        Args:
+            x: Time values (Series or array)
+            y: Trace values (Series or array)
+            n_out: Approximate number of points to keep
+
+        Returns:
+            (x, y) with only the kept points (all of them if short enough),
+            y as a float32 array
+        """
+        values = np.asarray(y, dtype=float)
+        if len(values) <= n_out:
+            return x, values.astype(PLOT_DTYPE)
+        idx = minmax_downsample_indices(values, n_out)
+        return getattr(x, "iloc", x)[idx], values[idx].astype(PLOT_DTYPE)
+
     def generate_matplotlib(self, output_path: Optional[Path] = None) -> Optional[Path]:
         """
         Generate static PNG chart using matplotlib.
@@ -146,12 +467,22 @@ class BaseChart(ABC):
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        cached = self._cache_path(f".{self.dpi}.png")
+        if cached is not None and cached.exists():
+            _link_or_copy(cached, output_path)
+            log.info(f"Reused cached matplotlib chart: {output_path}")
+            return output_path
+
         fig = self._create_matplotlib_figure()
         if fig is None:
             return None
 
-        fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight", facecolor="white")
+        # Never write through a hard link shared with the cache
+        output_path.unlink(missing_ok=True)
+        with matplotlib.rc_context(MATPLOTLIB_RENDER_PARAMS):
+            fig.savefig(output_path, dpi=self.dpi, bbox_inches="tight", facecolor="white")
         plt.close(fig)
+        self._store_cache(output_path, cached)
 
         log.info(f"Saved matplotlib chart: {output_path}")
         return output_path
@@ -178,15 +509,38 @@ class BaseChart(ABC):
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # The figure JSON is cached next to the HTML so the dashboard can reuse it
+        cached = self._cache_path(".html")
+        cached_json = self._cache_path(".json")
+        if cached is not None and cached.exists() and cached_json.exists():
+            _link_or_copy(cached, output_path)
+            self._plotly_json = cached_json.read_text(encoding="utf-8")
+            log.info(f"Reused cached plotly chart: {output_path}")
+            return output_path
+
         fig = self._create_plotly_figure()
+        self.plotly_figure = fig
+        self._plotly_json = None
         if fig is None:
             return None
 
-        fig.write_html(
-            str(output_path),
-            include_plotlyjs="cdn",
-            full_html=True
-        )
+        # Serialize once; the same JSON is cached and reused by the dashboard.
+        # "</" is escaped so the JSON cannot close the script tag. Never write
+        # through a hard link shared with the cache
+        output_path.unlink(missing_ok=True)
+        output_path.write_text(_CHART_HTML.substitute(
+            title=html.escape(self.title),
+            plotlyjs_src=plotlyjs_cdn_url(),
+            fig_json=self.plotly_json().replace("</", "<\\/"),
+        ), encoding="utf-8")
+
+        if cached is not None:
+            self._store_cache(output_path, cached)
+            try:
+                self._prepare_cache_entry(cached_json)
+                cached_json.write_text(self.plotly_json(), encoding="utf-8")
+            except OSError as e:
+                log.debug(f"Could not cache {cached_json.name}: {e}")
 
         log.info(f"Saved plotly chart: {output_path}")
         return output_path
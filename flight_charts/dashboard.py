@@ -1,8 +1,16 @@
 """Generate combined dashboard with all charts."""
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, TimeoutError, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from string import Template
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from .base import (
+    HAS_PANDAS, decimate_dataframe, plotlyjs_cdn_url, prepare_dataframe, records_cache_key
+)
 from .altitude_chart import AltitudeChart
 from .speed_chart import SpeedChart
 from .vertical_rate import VerticalRateChart
@@ -14,6 +22,9 @@ from .track_map import TrackMapChart
 
 log = logging.getLogger(__name__)
 
+# Seconds to wait for all worker processes before giving up on the rest
+CHART_POOL_TIMEOUT = 300
+
 # Chart classes in display order
 CHART_CLASSES = [
     TrackMapChart,       # Ground track map first
@@ -26,130 +37,13 @@ CHART_CLASSES = [
     AccuracyChart,
 ]
 
-
-def generate_all_charts(
-    records: List[dict],
-    callsign: str,
-    output_dir: Path,
-    generate_png: bool = True,
-    generate_html: bool = True,
-    dpi: int = 150,
-    max_points: int = 10000,
-    progress_callback: Optional[callable] = None
-) -> Dict[str, Tuple[Optional[Path], Optional[Path]]]:
-    """
-    Generate all chart types for a flight.
-
-    Args:
-        records: Flight data records
-        callsign: Flight callsign for titles
-        output_dir: Directory for output files
-        generate_png: Whether to generate matplotlib PNG files
-        generate_html: Whether to generate plotly HTML files
-        dpi: DPI for PNG output
-        max_points: Max points before decimation
-        progress_callback: Optional callback(current, total, chart_name)
-
-    Returns:
-        Dict mapping chart name to (png_path, html_path) tuples
-    """
-    results = {}
-    total = len(CHART_CLASSES)
-
-    for i, ChartClass in enumerate(CHART_CLASSES):
-        chart_name = ChartClass.__name__
-
-        if progress_callback:
-            progress_callback(i + 1, total, chart_name)
-
-        try:
-            chart = ChartClass(
-                records=records,
-                callsign=callsign,
-                output_dir=output_dir,
-                dpi=dpi,
-                max_points=max_points
-            )
-
-            png_path = None
-            html_path = None
-
-            if generate_png:
-                try:
-                    png_path = chart.generate_matplotlib()
-                except Exception as e:
-                    log.warning(f"Failed to generate PNG for {chart_name}: {e}")
-
-            if generate_html:
-                try:
-                    html_path = chart.generate_plotly()
-                except Exception as e:
-                    log.warning(f"Failed to generate HTML for {chart_name}: {e}")
-
-            results[chart.name] = (png_path, html_path)
-
-        except Exception as e:
-            log.error(f"Failed to create chart {chart_name}: {e}")
-
-    return results
-
-
-def generate_dashboard(
-    records: List[dict],
-    callsign: str,
-    output_dir: Path,
-    flight_metadata: Optional[dict] = None
-) -> Optional[Path]:
-    """
-    Generate a combined HTML dashboard with all charts embedded.
-
-    Args:
-        records: Flight data records
-        callsign: Flight callsign
-        output_dir: Directory for output
-        flight_metadata: Optional metadata dict for header info
-
-    Returns:
-        Path to dashboard.html file
-    """
-    try:
-        import plotly.graph_objects as go
-        from plotly.subplots import make_subplots
-    except ImportError:
-        log.warning("plotly not available - cannot generate dashboard")
-        return None
-
-    output_path = output_dir / "charts" / "dashboard.html"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Generate individual chart figures
-    charts = []
-
-    for ChartClass in CHART_CLASSES:
-        try:
-            chart = ChartClass(
-                records=records,
-                callsign=callsign,
-                output_dir=output_dir
-            )
-            fig = chart._create_plotly_figure()
-            if fig is not None:
-                charts.append((chart.title, fig))
-        except Exception as e:
-            log.warning(f"Failed to create dashboard chart {ChartClass.__name__}: {e}")
-
-    if not charts:
-        log.warning("No charts generated for dashboard")
-        return None
-
-    # Build combined HTML
-    html_parts = [
-        """<!DOCTYPE html>
+_DASHBOARD_HEADER = Template("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
-    <title>Flight Dashboard - """ + callsign + """</title>
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
+    <title>Flight Dashboard - $callsign</title>
+    <script src="$plotlyjs_src"></script>
+    <script>var DASHBOARD_CONFIG = {"responsive": true};</script>
     <style>
         body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
@@ -206,51 +100,376 @@ def generate_dashboard(
 </head>
 <body>
     <div class="header">
-        <h1>Flight Dashboard: """ + callsign + """</h1>
+        <h1>Flight Dashboard: $callsign</h1>
         <div class="meta">
-"""
-    ]
-
-    # Add metadata to header
-    if flight_metadata:
-        if flight_metadata.get("aircraft_type"):
-            html_parts.append(f'            <span>Aircraft: {flight_metadata["aircraft_type"]}</span>\n')
-        if flight_metadata.get("registration"):
-            html_parts.append(f'            <span>Reg: {flight_metadata["registration"]}</span>\n')
-        if flight_metadata.get("duration_minutes"):
-            html_parts.append(f'            <span>Duration: {flight_metadata["duration_minutes"]:.0f} min</span>\n')
-        if flight_metadata.get("max_altitude_ft"):
-            html_parts.append(f'            <span>Max Alt: {flight_metadata["max_altitude_ft"]:.0f} ft</span>\n')
-        if flight_metadata.get("records_extracted"):
-            html_parts.append(f'            <span>Records: {flight_metadata["records_extracted"]}</span>\n')
-
-    html_parts.append("""        </div>
+$meta        </div>
     </div>
 """)
 
-    # Add each chart
-    for i, (title, fig) in enumerate(charts):
-        # Get the plotly HTML div
-        chart_html = fig.to_html(
-            include_plotlyjs=False,
-            full_html=False,
-            div_id=f"chart_{i}"
-        )
-
-        html_parts.append(f"""    <div class="chart-container">
-        <div class="chart-title">{title}</div>
-        {chart_html}
+_DASHBOARD_CHART = Template("""    <div class="chart-container">
+        <div class="chart-title">$title</div>
+        <div id="$div_id" class="plotly-graph-div" style="width:100%;"></div>
+        <script>
+            (function () {
+                var fig = $fig_json;
+                Plotly.newPlot("$div_id", fig.data, fig.layout, DASHBOARD_CONFIG);
+            })();
+        </script>
     </div>
 """)
 
-    html_parts.append("""    <div class="footer">
+_DASHBOARD_FOOTER = """    <div class="footer">
         Generated by ADS-B Flight Analyzer
     </div>
 </body>
-</html>""")
+</html>"""
+
+
+def _shared_dataframe(records: List[dict], max_points: int):
+    """Prepare one decimated DataFrame for all charts, or None without pandas."""
+    if not HAS_PANDAS:
+        return None
+    return decimate_dataframe(prepare_dataframe(records), max_points)
+
+
+def _applicable_chart_classes(df, records: List[dict]) -> List[type]:
+    """Return the chart classes whose required columns appear in the data."""
+    if df is not None:
+        present = set(df.columns)
+    else:
+        present = set()
+        for record in records:
+            present.update(record)
+
+    return [
+        ChartClass for ChartClass in CHART_CLASSES
+        if not ChartClass.REQUIRED_ANY_COLS
+        or present.intersection(ChartClass.REQUIRED_ANY_COLS)
+    ]
+
+
+def _figure_json(fig) -> str:
+    """Serialize a plotly figure compactly for embedding in the dashboard."""
+    import plotly.io as pio
+    return pio.to_json(fig, validate=False, pretty=False)
+
+
+def _run_one_chart(
+    ChartClass: type,
+    records: List[dict],
+    callsign: str,
+    output_dir: Path,
+    dpi: int,
+    max_points: int,
+    df,
+    generate_png: bool,
+    generate_html: bool,
+    collect_figures: bool = False,
+    cache_key: Optional[str] = None
+) -> Optional[tuple]:
+    """
+    Build one chart and write its outputs.
+
+    Top-level so it can run in a worker process. Returns
+    (chart.name, png_path, html_path, figure), or None if the chart could
+    not be created. figure is (title, plotly JSON) when collect_figures is
+    set and an HTML figure was built, else None.
+    """
+    chart_name = ChartClass.__name__
+
+    try:
+        chart = ChartClass(
+            records=records,
+            callsign=callsign,
+            output_dir=output_dir,
+            dpi=dpi,
+            max_points=max_points,
+            df=df,
+            cache_key=cache_key
+        )
+
+        png_path = None
+        html_path = None
+
+        if generate_png:
+            try:
+                png_path = chart.generate_matplotlib()
+            except Exception as e:
+                log.warning(f"Failed to generate PNG for {chart_name}: {e}")
+
+        if generate_html:
+            try:
+                html_path = chart.generate_plotly()
+            except Exception as e:
+                log.warning(f"Failed to generate HTML for {chart_name}: {e}")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("".join(html_parts))
+        figure = None
+        if collect_figures and html_path is not None:
+            figure = (chart.title, chart.plotly_json())
+
+        return (chart.name, png_path, html_path, figure)
+
+    except Exception as e:
+        log.error(f"Failed to create chart {chart_name}: {e}")
+        return None
+
+
+def _pool_context():
+    """
+    Start method for chart worker processes.
+
+    Never fork: callers such as the Telegram bots run this from executor
+    threads, and a forked child can deadlock on locks held by other threads.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _run_charts_in_pool(
+    chart_classes: List[type],
+    chart_records: List[dict],
+    job_args: tuple,
+    max_workers: int,
+    progress_callback: Optional[callable]
+) -> dict:
+    """
+    Render charts in worker processes.
+
+    Returns {ChartClass: outcome}. Charts that failed in a worker are left
+    out so they are retried serially; charts still running after
+    CHART_POOL_TIMEOUT map to None and are abandoned.
+    """
+    total = len(chart_classes)
+    outcomes = {}
+    pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=_pool_context())
+    futures = {}
+    try:
+        futures = {
+            pool.submit(_run_one_chart, ChartClass, chart_records, *job_args): ChartClass
+            for ChartClass in chart_classes
+        }
+        for i, future in enumerate(as_completed(futures, timeout=CHART_POOL_TIMEOUT)):
+            ChartClass = futures[future]
+            if progress_callback:
+                progress_callback(i + 1, total, ChartClass.__name__)
+            try:
+                outcomes[ChartClass] = future.result()
+            except Exception as e:
+                log.error(f"Failed to create chart {ChartClass.__name__}: {e}")
+    except TimeoutError:
+        for future, ChartClass in futures.items():
+            if not future.done():
+                future.cancel()
+                outcomes[ChartClass] = None
+                log.error(f"Chart {ChartClass.__name__} timed out after {CHART_POOL_TIMEOUT}s")
+        # shutdown() cannot stop a running task; terminate the stuck workers
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+    finally:
+        pool.shutdown(wait=False)
+    return outcomes
+
+
+def generate_all_charts(
+    records: List[dict],
+    callsign: str,
+    output_dir: Path,
+    generate_png: bool = True,
+    generate_html: bool = True,
+    dpi: int = 150,
+    max_points: int = 10000,
+    progress_callback: Optional[callable] = None,
+    max_workers: Optional[int] = 1,
+    figure_cache: Optional[Dict[str, Tuple[str, str]]] = None,
+    use_cache: bool = False
+) -> Dict[str, Tuple[Optional[Path], Optional[Path]]]:
+    """
+    Generate all chart types for a flight.
+
+    Charts are independent, so they can be rendered in a process pool
+    (see max_workers).
+
+    Args:
+        records: Flight data records
+        callsign: Flight callsign for titles
+        output_dir: Directory for output files
+        generate_png: Whether to generate matplotlib PNG files
+        generate_html: Whether to generate plotly HTML files
+        dpi: DPI for PNG output
+        max_points: Max points before decimation
+        progress_callback: Optional callback(current, total, chart_name)
+        max_workers: Worker processes to use. The default of 1 renders
+            serially in this process; None uses one per chart, capped at
+            the CPU count
+        figure_cache: Optional dict filled with {chart name: (title, plotly
+            JSON)} for each HTML chart, to pass to generate_dashboard(prebuilt=...)
+        use_cache: Reuse outputs from output_dir/.chart_cache when the same
+            flight (callsign, record count, first/last timestamp) is
+            re-extracted into the same directory, and keep the new outputs
+            there
+
+    Returns:
+        Dict mapping chart name to (png_path, html_path) tuples
+    """
+    df = _shared_dataframe(records, max_points)
+    chart_classes = _applicable_chart_classes(df, records)
+    total = len(chart_classes)
+
+    # Workers only need the prepared DataFrame, not the raw records
+    chart_records = records if df is None else []
+    # Charts use the key to reuse and store outputs in .chart_cache
+    cache_key = records_cache_key(records, callsign, max_points) if use_cache and records else None
+    job_args = (callsign, output_dir, dpi, max_points, df, generate_png, generate_html,
+                figure_cache is not None, cache_key)
+
+    if max_workers is None:
+        max_workers = min(total, os.cpu_count() or 1)
+
+    outcomes = {}
+
+    if max_workers > 1 and total > 1:
+        try:
+            outcomes = _run_charts_in_pool(
+                chart_classes, chart_records, job_args, max_workers, progress_callback
+            )
+        except (OSError, BrokenProcessPool) as e:
+            log.warning(f"Process pool unavailable ({e}) - rendering charts serially")
+            outcomes = {}
+
+    for i, ChartClass in enumerate(chart_classes):
+        if ChartClass in outcomes:
+            continue
+        if progress_callback:
+            progress_callback(i + 1, total, ChartClass.__name__)
+        outcomes[ChartClass] = _run_one_chart(ChartClass, chart_records, *job_args)
+
+    # Report results in display order
+    results = {}
+    for ChartClass in chart_classes:
+        outcome = outcomes.get(ChartClass)
+        if outcome is not None:
+            name, png_path, html_path, figure = outcome
+            results[name] = (png_path, html_path)
+            if figure_cache is not None and figure is not None:
+                figure_cache[name] = figure
+
+    return results
+
+
+def _dashboard_meta(flight_metadata: Optional[dict]) -> str:
+    """Build the header metadata <span> lines for the dashboard."""
+    if not flight_metadata:
+        return ""
+
+    spans = []
+    if flight_metadata.get("aircraft_type"):
+        spans.append(f'Aircraft: {flight_metadata["aircraft_type"]}')
+    if flight_metadata.get("registration"):
+        spans.append(f'Reg: {flight_metadata["registration"]}')
+    if flight_metadata.get("duration_minutes"):
+        spans.append(f'Duration: {flight_metadata["duration_minutes"]:.0f} min')
+    if flight_metadata.get("max_altitude_ft"):
+        spans.append(f'Max Alt: {flight_metadata["max_altitude_ft"]:.0f} ft')
+    if flight_metadata.get("records_extracted"):
+        spans.append(f'Records: {flight_metadata["records_extracted"]}')
+
+    return "".join(f"            <span>{text}</span>\n" for text in spans)
+
+
+def _dashboard_figures(
+    records: List[dict],
+    callsign: str,
+    output_dir: Path,
+    df: Optional['pd.DataFrame'],
+    prebuilt: Optional[Dict[str, Tuple[str, str]]]
+) -> Iterator[Tuple[str, str]]:
+    """Yield (title, plotly JSON) per dashboard chart, in display order."""
+    if prebuilt:
+        # generate_all_charts fills the cache in display order
+        yield from prebuilt.values()
+        return
+
+    for ChartClass in _applicable_chart_classes(df, records):
+        try:
+            chart = ChartClass(
+                records=records,
+                callsign=callsign,
+                output_dir=output_dir,
+                df=df
+            )
+            fig = chart._create_plotly_figure()
+        except Exception as e:
+            log.warning(f"Failed to create dashboard chart {ChartClass.__name__}: {e}")
+            continue
+
+        if fig is None:
+            continue
+
+        yield (chart.title, _figure_json(fig))
+
+
+def generate_dashboard(
+    records: List[dict],
+    callsign: str,
+    output_dir: Path,
+    flight_metadata: Optional[dict] = None,
+    max_points: int = 10000,
+    prebuilt: Optional[Dict[str, Tuple[str, str]]] = None
+) -> Optional[Path]:
+    """
+    Generate a combined HTML dashboard with all charts embedded.
+
+    Args:
+        records: Flight data records
+        callsign: Flight callsign
+        output_dir: Directory for output
+        flight_metadata: Optional metadata dict for header info
+        max_points: Max points before decimation
+        prebuilt: Optional {chart name: (title, plotly JSON)} from
+            generate_all_charts(figure_cache=...); figures are rebuilt if empty
+
+    Returns:
+        Path to dashboard.html file
+    """
+    try:
+        import plotly.io as pio
+    except ImportError:
+        log.warning("plotly not available - cannot generate dashboard")
+        return None
+
+    output_path = output_dir / "charts" / "dashboard.html"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    df = None if prebuilt else _shared_dataframe(records, max_points)
+    charts_written = 0
+
+    # Stream the HTML to disk so only one chart's markup is held at a time
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(_DASHBOARD_HEADER.substitute(
+            callsign=callsign,
+            plotlyjs_src=plotlyjs_cdn_url(),
+            meta=_dashboard_meta(flight_metadata),
+        ))
+
+        # Add each chart as soon as its figure is built (or reuse the JSON
+        # already built by generate_all_charts)
+        for title, fig_json in _dashboard_figures(records, callsign, output_dir, df, prebuilt):
+            # Embed the figure JSON directly and render it with the shared config;
+            # "</" is escaped so the JSON cannot close the script tag
+            div_id = f"chart_{charts_written}"
+            fig_json = fig_json.replace("</", "<\\/")
+
+            f.write(_DASHBOARD_CHART.substitute(
+                title=title, div_id=div_id, fig_json=fig_json))
+            charts_written += 1
+
+        f.write(_DASHBOARD_FOOTER)
+
+    if not charts_written:
+        log.warning("No charts generated for dashboard")
+        output_path.unlink(missing_ok=True)
+        return None
 
     log.info(f"Dashboard saved to {output_path}")
     return output_path
@@ -1,14 +1,17 @@
 """Flight phase detection and visualization."""
 import logging
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, List, Tuple
 import numpy as np
 
-from .base import BaseChart, HAS_MATPLOTLIB, HAS_PLOTLY, HAS_PANDAS
+from .base import BaseChart, HAS_MATPLOTLIB, HAS_PLOTLY, HAS_PANDAS, HAS_NUMBA, NUMBA_MIN_POINTS, lazy_njit
 
 if HAS_MATPLOTLIB:
     import matplotlib.pyplot as plt
     import matplotlib.patches as mpatches
+    import matplotlib.dates as mdates
+    from matplotlib.collections import LineCollection
 if HAS_PLOTLY:
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
@@ -32,6 +35,12 @@ PHASE_COLORS = {
 
 PHASE_ORDER = ["ground", "takeoff", "climb", "cruise", "descent", "approach", "landing"]
 
+# Categories of the phase Series returned by detect_flight_phases
+PHASE_CATEGORIES = PHASE_ORDER + ["unknown"]
+UNKNOWN_CODE = PHASE_CATEGORIES.index("unknown")
+
+# Phase codes (indices into PHASE_ORDER) as plain ints for the compiled classifier
+_GROUND, _TAKEOFF, _CLIMB, _CRUISE, _DESCENT, _APPROACH, _LANDING = range(7)
 
 def detect_flight_phases(df: 'pd.DataFrame') -> 'pd.Series':
     """
@@ -47,10 +56,9 @@ def detect_flight_phases(df: 'pd.DataFrame') -> 'pd.Series':
     - landing: altitude < 500 ft and descending/slowing
 
     Returns:
-        Series with phase labels
+        Categorical Series with phase labels (categories PHASE_CATEGORIES)
     """
-    phases = pd.Series(index=df.index, dtype=str)
-    phases[:] = "unknown"
+    phases = _phase_series(np.full(len(df), UNKNOWN_CODE, dtype=np.int8), df.index)
 
     # Get required columns
     alt = df.get("alt_baro", df.get("alt_geom", pd.Series()))
@@ -61,14 +69,20 @@ def detect_flight_phases(df: 'pd.DataFrame') -> 'pd.Series':
         return phases
 
     # Fill NaN values for calculations
-    alt = pd.to_numeric(alt, errors='coerce').fillna(method='ffill').fillna(method='bfill')
+    alt = pd.to_numeric(alt, errors='coerce').ffill().bfill()
     vrate = pd.to_numeric(vrate, errors='coerce').fillna(0)
     gs = pd.to_numeric(gs, errors='coerce').fillna(0)
 
     # Smooth the data to reduce noise
-    if len(alt) > 10:
+    if len(alt) > 10 and len(vrate) == len(alt):
+        # One rolling pass over both columns
+        smooth = pd.DataFrame({"alt": alt, "vrate": vrate}).rolling(
+            window=10, center=True, min_periods=1).mean()
+        alt_smooth = smooth["alt"]
+        vrate_smooth = smooth["vrate"]
+    elif len(alt) > 10:
         alt_smooth = alt.rolling(window=10, center=True, min_periods=1).mean()
-        vrate_smooth = vrate.rolling(window=10, center=True, min_periods=1).mean()
+        vrate_smooth = vrate
     else:
         alt_smooth = alt
         vrate_smooth = vrate
@@ -77,42 +91,77 @@ def detect_flight_phases(df: 'pd.DataFrame') -> 'pd.Series':
     max_alt = alt_smooth.max()
     cruise_threshold = max_alt * 0.85 if max_alt > 10000 else max_alt * 0.7
 
-    # Classify each point
-    for i in range(len(df)):
-        a = alt_smooth.iloc[i]
-        v = vrate_smooth.iloc[i]
-        s = gs.iloc[i] if len(gs) > i else 0
-
-        # Ground
-        if a < 500 and s < 50:
-            phases.iloc[i] = "ground"
-        # Takeoff
-        elif a < 3000 and v > 500 and i < len(df) * 0.2:
-            phases.iloc[i] = "takeoff"
-        # Landing
-        elif a < 500 and v < 0 and i > len(df) * 0.7:
-            phases.iloc[i] = "landing"
-        # Approach
-        elif a < 5000 and v < -200 and i > len(df) * 0.6:
-            phases.iloc[i] = "approach"
-        # Climb
-        elif v > 300:
-            phases.iloc[i] = "climb"
-        # Descent
-        elif v < -300:
-            phases.iloc[i] = "descent"
-        # Cruise
-        elif a > cruise_threshold and abs(v) < 500:
-            phases.iloc[i] = "cruise"
-        # Default to climb or descent based on vertical rate
-        elif v > 0:
-            phases.iloc[i] = "climb"
-        elif v < 0:
-            phases.iloc[i] = "descent"
+    # Classify every point at once; conditions are checked in priority order
+    n = len(df)
+    a = alt_smooth.to_numpy(dtype=np.float64)
+    v = vrate_smooth.to_numpy(dtype=np.float64) if len(vrate_smooth) == n else np.zeros(n)
+    s = gs.to_numpy(dtype=np.float64) if len(gs) == n else np.zeros(n)
+
+    if HAS_NUMBA and n >= NUMBA_MIN_POINTS:
+        return _phase_series(_classify_phases(a, v, s, cruise_threshold), df.index)
+
+    idx = np.arange(n)
+
+    conditions = [
+        (a < 500) & (s < 50),                       # Ground
+        (a < 3000) & (v > 500) & (idx < n * 0.2),   # Takeoff
+        (a < 500) & (v < 0) & (idx > n * 0.7),      # Landing
+        (a < 5000) & (v < -200) & (idx > n * 0.6),  # Approach
+        v > 300,                                    # Climb
+        v < -300,                                   # Descent
+        (a > cruise_threshold) & (np.abs(v) < 500), # Cruise
+        v > 0,                                      # Default to climb or descent
+        v < 0,                                      # based on vertical rate
+    ]
+    choices = ["ground", "takeoff", "landing", "approach", "climb", "descent",
+               "cruise", "climb", "descent"]
+    code_choices = [PHASE_CATEGORIES.index(c) for c in choices]
+
+    codes = np.select(conditions, code_choices,
+                      default=PHASE_CATEGORIES.index("cruise")).astype(np.int8)
+
+    return _phase_series(codes, df.index)
+
+
+@lazy_njit(cache=True)
+def _classify_phases(a, v, s, cruise_threshold):
+    """
+    Single-pass equivalent of the np.select classifier in detect_flight_phases.
+
+    Avoids the boolean mask temporaries on very large (undecimated) flights.
+    """
+    n = len(a)
+    codes = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        ai = a[i]
+        vi = v[i]
+        if ai < 500 and s[i] < 50:
+            codes[i] = _GROUND
+        elif ai < 3000 and vi > 500 and i < n * 0.2:
+            codes[i] = _TAKEOFF
+        elif ai < 500 and vi < 0 and i > n * 0.7:
+            codes[i] = _LANDING
+        elif ai < 5000 and vi < -200 and i > n * 0.6:
+            codes[i] = _APPROACH
+        elif vi > 300:
+            codes[i] = _CLIMB
+        elif vi < -300:
+            codes[i] = _DESCENT
+        elif ai > cruise_threshold and abs(vi) < 500:
+            codes[i] = _CRUISE
+        elif vi > 0:
+            codes[i] = _CLIMB
+        elif vi < 0:
+            codes[i] = _DESCENT
         else:
-            phases.iloc[i] = "cruise"
+            codes[i] = _CRUISE
+    return codes
+
 
-    return phases
+def _phase_series(codes: 'np.ndarray', index: 'pd.Index') -> 'pd.Series':
+    """Wrap int8 phase codes as a Categorical Series over PHASE_CATEGORIES."""
+    return pd.Series(pd.Categorical.from_codes(codes, categories=PHASE_CATEGORIES),
+                     index=index)
 
 
 def get_phase_summary(phases: 'pd.Series', df: 'pd.DataFrame') -> List[dict]:
@@ -122,48 +171,33 @@ def get_phase_summary(phases: 'pd.Series', df: 'pd.DataFrame') -> List[dict]:
     if "datetime" not in df.columns:
         return []
 
+    if len(phases) == 0:
+        return []
+
+    # Run-length encode on integer codes: indices where a new phase begins
+    if isinstance(phases.dtype, pd.CategoricalDtype):
+        arr = phases.cat.codes.to_numpy()
+        labels = list(phases.cat.categories)
+    else:
+        arr, labels = pd.factorize(phases)
+        labels = list(labels)
+    boundaries = np.concatenate([[0], np.flatnonzero(arr[1:] != arr[:-1]) + 1, [len(arr)]])
+
+    times = df["datetime"]
+    alt = df["alt_baro"].to_numpy() if "alt_baro" in df.columns else None
+
     summary = []
-    current_phase = None
-    phase_start = None
-    phase_start_idx = None
-
-    for i, phase in enumerate(phases):
-        if phase != current_phase:
-            # End previous phase
-            if current_phase is not None:
-                phase_end = df["datetime"].iloc[i-1]
-                duration = (phase_end - phase_start).total_seconds() / 60
-
-                # Get altitude stats for this phase
-                phase_alt = df["alt_baro"].iloc[phase_start_idx:i] if "alt_baro" in df.columns else None
-
-                summary.append({
-                    "phase": current_phase,
-                    "start": phase_start,
-                    "end": phase_end,
-                    "duration_min": duration,
-                    "start_alt": phase_alt.iloc[0] if phase_alt is not None and len(phase_alt) > 0 else None,
-                    "end_alt": phase_alt.iloc[-1] if phase_alt is not None and len(phase_alt) > 0 else None,
-                })
-
-            # Start new phase
-            current_phase = phase
-            phase_start = df["datetime"].iloc[i]
-            phase_start_idx = i
-
-    # End final phase
-    if current_phase is not None:
-        phase_end = df["datetime"].iloc[-1]
-        duration = (phase_end - phase_start).total_seconds() / 60
-        phase_alt = df["alt_baro"].iloc[phase_start_idx:] if "alt_baro" in df.columns else None
+    for start, end in zip(boundaries[:-1], boundaries[1:]):
+        phase_start = times.iloc[start]
+        phase_end = times.iloc[end - 1]
 
         summary.append({
-            "phase": current_phase,
+            "phase": labels[arr[start]],
             "start": phase_start,
             "end": phase_end,
-            "duration_min": duration,
-            "start_alt": phase_alt.iloc[0] if phase_alt is not None and len(phase_alt) > 0 else None,
-            "end_alt": phase_alt.iloc[-1] if phase_alt is not None and len(phase_alt) > 0 else None,
+            "duration_min": (phase_end - phase_start).total_seconds() / 60,
+            "start_alt": alt[start] if alt is not None else None,
+            "end_alt": alt[end - 1] if alt is not None else None,
         })
 
     return summary
@@ -179,6 +213,8 @@ class FlightPhaseChart(BaseChart):
     - Phase duration summary
     """
 
+    REQUIRED_ANY_COLS = ("alt_baro",)
+
     @property
     def name(self) -> str:
         return "flight_phases"
@@ -196,8 +232,26 @@ class FlightPhaseChart(BaseChart):
             self.phases = None
             self.phase_summary = []
 
+    @cached_property
+    def _phase_points(self) -> List[Tuple[str, 'np.ndarray', 'np.ndarray']]:
+        """
+        Split datetime/altitude into per-phase arrays, in PHASE_ORDER.
+
+        Only phases that occur are returned, as (phase, times, altitudes).
+        """
+        times = self.df["datetime"].to_numpy(dtype="datetime64[ns]")
+        alts = self.df["alt_baro"].to_numpy()
+        codes = self.phases.cat.codes.to_numpy()
+
+        points = []
+        for k, phase in enumerate(PHASE_ORDER):
+            idx = np.flatnonzero(codes == k)
+            if len(idx):
+                points.append((phase, times[idx], alts[idx]))
+        return points
+
     def _create_matplotlib_figure(self) -> Optional['plt.Figure']:
-        if not HAS_MATPLOTLIB or self.df is None or self.phases is None:
+        if not HAS_MATPLOTLIB or self.df is None or self.df.empty or self.phases is None:
             return None
 
         df = self.df
@@ -206,23 +260,23 @@ class FlightPhaseChart(BaseChart):
         if "datetime" not in df.columns:
             return None
 
-        has_alt = "alt_baro" in df.columns and df["alt_baro"].notna().any()
+        has_alt = self._has_column("alt_baro")
         if not has_alt:
             return None
 
         # Create figure with altitude plot and phase bar
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 7),
                                         gridspec_kw={"height_ratios": [4, 1]},
-                                        sharex=True)
+                                        sharex=True,
+                                        constrained_layout=True)
+
+        phase_points = self._phase_points
 
         # Plot altitude colored by phase
-        for phase in PHASE_ORDER:
-            mask = phases == phase
-            if mask.any():
-                ax1.scatter(df.loc[mask, "datetime"],
-                           df.loc[mask, "alt_baro"],
-                           c=PHASE_COLORS[phase],
-                           s=2, alpha=0.7, label=phase.capitalize())
+        for phase, times, alts in phase_points:
+            ax1.scatter(times, alts, c=PHASE_COLORS[phase],
+                       s=2, alpha=0.7, label=phase.capitalize(),
+                       rasterized=True)
 
         ax1.set_ylabel("Altitude (ft)")
         ax1.set_title(self.title)
@@ -233,10 +287,15 @@ class FlightPhaseChart(BaseChart):
         ax1.yaxis.set_major_formatter(plt.FuncFormatter(
             lambda x, p: f"{x/1000:.0f}k" if x >= 1000 else f"{x:.0f}"))
 
-        # Phase timeline bar
-        for i, (phase, x) in enumerate(zip(phases, df["datetime"])):
-            ax2.axvline(x=x, color=PHASE_COLORS.get(phase, "#CCCCCC"),
-                       linewidth=2, alpha=0.8)
+        # Phase timeline bar - one vertical segment per point in a single artist
+        x = mdates.date2num(df["datetime"].to_numpy(dtype="datetime64[ns]"))
+        segments = np.stack([np.column_stack([x, np.zeros_like(x)]),
+                             np.column_stack([x, np.ones_like(x)])], axis=1)
+        palette = np.array([PHASE_COLORS[p] for p in PHASE_CATEGORIES])
+        colors = palette[phases.cat.codes.to_numpy()].tolist()
+        ax2.add_collection(LineCollection(segments, colors=colors,
+                                          linewidths=2, alpha=0.8,
+                                          rasterized=True))
 
         ax2.set_ylim(0, 1)
         ax2.set_yticks([])
@@ -244,26 +303,24 @@ class FlightPhaseChart(BaseChart):
 
         # Create legend patches
         patches = [mpatches.Patch(color=PHASE_COLORS[p], label=p.capitalize())
-                   for p in PHASE_ORDER if (phases == p).any()]
+                   for p, _, _ in phase_points]
         ax2.legend(handles=patches, loc="upper center", ncol=len(patches),
                    fontsize=8, framealpha=0.9)
 
         self._format_time_axis(ax2)
-        plt.tight_layout()
 
         return fig
 
     def _create_plotly_figure(self) -> Optional['go.Figure']:
-        if not HAS_PLOTLY or self.df is None or self.phases is None:
+        if not HAS_PLOTLY or self.df is None or self.df.empty or self.phases is None:
             return None
 
         df = self.df
-        phases = self.phases
 
         if "datetime" not in df.columns:
             return None
 
-        has_alt = "alt_baro" in df.columns and df["alt_baro"].notna().any()
+        has_alt = self._has_column("alt_baro")
         if not has_alt:
             return None
 
@@ -275,38 +332,36 @@ class FlightPhaseChart(BaseChart):
             subplot_titles=(self.title, "Flight Phase")
         )
 
+        phase_points = self._phase_points
+
         # Plot altitude for each phase
-        for phase in PHASE_ORDER:
-            mask = phases == phase
-            if mask.any():
-                fig.add_trace(
-                    go.Scatter(
-                        x=df.loc[mask, "datetime"],
-                        y=df.loc[mask, "alt_baro"],
-                        mode="markers",
-                        marker=dict(color=PHASE_COLORS[phase], size=4),
-                        name=phase.capitalize(),
-                        hovertemplate=f"<b>{phase.capitalize()}</b><br>Alt: %{{y:.0f}} ft<extra></extra>"
-                    ),
-                    row=1, col=1
-                )
+        for phase, times, alts in phase_points:
+            fig.add_trace(
+                go.Scatter(
+                    x=times,
+                    y=alts,
+                    mode="markers",
+                    marker=dict(color=PHASE_COLORS[phase], size=4),
+                    name=phase.capitalize(),
+                    hovertemplate=f"<b>{phase.capitalize()}</b><br>Alt: %{{y:.0f}} ft<extra></extra>"
+                ),
+                row=1, col=1
+            )
 
         # Phase timeline
-        for phase in PHASE_ORDER:
-            mask = phases == phase
-            if mask.any():
-                fig.add_trace(
-                    go.Scatter(
-                        x=df.loc[mask, "datetime"],
-                        y=[0.5] * mask.sum(),
-                        mode="markers",
-                        marker=dict(color=PHASE_COLORS[phase], size=10, symbol="square"),
-                        name=phase.capitalize(),
-                        showlegend=False,
-                        hovertemplate=f"<b>{phase.capitalize()}</b><extra></extra>"
-                    ),
-                    row=2, col=1
-                )
+        for phase, times, _ in phase_points:
+            fig.add_trace(
+                go.Scatter(
+                    x=times,
+                    y=np.full(len(times), 0.5),
+                    mode="markers",
+                    marker=dict(color=PHASE_COLORS[phase], size=10, symbol="square"),
+                    name=phase.capitalize(),
+                    showlegend=False,
+                    hovertemplate=f"<b>{phase.capitalize()}</b><extra></extra>"
+                ),
+                row=2, col=1
+            )
 
         fig.update_layout(
             height=500,
@@ -2,6 +2,7 @@
 import logging
 from pathlib import Path
 from typing import Optional
+import numpy as np
 
 from .base import BaseChart, HAS_MATPLOTLIB, HAS_PLOTLY
 
@@ -24,6 +25,8 @@ class SignalChart(BaseChart):
     - Position update frequency (based on seen_pos)
     """
 
+    REQUIRED_ANY_COLS = ("rssi", "messages")
+
     @property
     def name(self) -> str:
         return "signal_quality"
@@ -33,7 +36,7 @@ class SignalChart(BaseChart):
         return f"{self.callsign} - Signal Quality"
 
     def _create_matplotlib_figure(self) -> Optional['plt.Figure']:
-        if not HAS_MATPLOTLIB or self.df is None:
+        if not HAS_MATPLOTLIB or self.df is None or self.df.empty:
             return None
 
         df = self.df
@@ -41,9 +44,9 @@ class SignalChart(BaseChart):
         if "datetime" not in df.columns:
             return None
 
-        has_rssi = "rssi" in df.columns and df["rssi"].notna().any()
-        has_messages = "messages" in df.columns and df["messages"].notna().any()
-        has_distance = "r_dst" in df.columns and df["r_dst"].notna().any()
+        has_rssi = self._has_column("rssi")
+        has_messages = self._has_column("messages")
+        has_distance = self._has_column("r_dst")
 
         if not has_rssi and not has_messages:
             log.warning("No signal data for chart")
@@ -54,7 +57,8 @@ class SignalChart(BaseChart):
         if n_plots == 0:
             return None
 
-        fig, axes = plt.subplots(n_plots, 1, figsize=(12, 4 * n_plots), sharex=True)
+        fig, axes = plt.subplots(n_plots, 1, figsize=(12, 4 * n_plots), sharex=True,
+                                 constrained_layout=True)
         if n_plots == 1:
             axes = [axes]
 
@@ -63,8 +67,9 @@ class SignalChart(BaseChart):
         # RSSI
         if has_rssi:
             ax = axes[plot_idx]
-            ax.plot(df["datetime"], df["rssi"], "b-", linewidth=1, alpha=0.7)
-            ax.fill_between(df["datetime"], df["rssi"].min(), df["rssi"],
+            times, rssi = self._trace("rssi")
+            ax.plot(times, rssi, "b-", linewidth=1, alpha=0.7)
+            ax.fill_between(times, np.nanmin(rssi), rssi,
                           alpha=0.3, color="blue")
             ax.set_ylabel("RSSI (dBFS)")
             ax.grid(True, alpha=0.3)
@@ -82,13 +87,13 @@ class SignalChart(BaseChart):
             ax = axes[plot_idx]
 
             if has_messages:
-                ax.plot(df["datetime"], df["messages"], "g-", linewidth=1,
+                ax.plot(*self._trace("messages"), "g-", linewidth=1,
                        alpha=0.8, label="Message Count")
                 ax.set_ylabel("Messages")
 
             if has_distance:
                 ax2 = ax.twinx() if has_messages else ax
-                ax2.plot(df["datetime"], df["r_dst"], "m-", linewidth=1,
+                ax2.plot(*self._trace("r_dst"), "m-", linewidth=1,
                         alpha=0.7, label="Distance")
                 ax2.set_ylabel("Distance (nm)", color="magenta")
                 ax2.tick_params(axis="y", labelcolor="magenta")
@@ -103,12 +108,11 @@ class SignalChart(BaseChart):
         self._format_time_axis(axes[-1])
         axes[-1].set_xlabel("Time (UTC)")
 
-        plt.suptitle(self.title, y=1.02)
-        plt.tight_layout()
+        fig.suptitle(self.title)
         return fig
 
     def _create_plotly_figure(self) -> Optional['go.Figure']:
-        if not HAS_PLOTLY or self.df is None:
+        if not HAS_PLOTLY or self.df is None or self.df.empty:
             return None
 
         df = self.df
@@ -116,9 +120,9 @@ class SignalChart(BaseChart):
         if "datetime" not in df.columns:
             return None
 
-        has_rssi = "rssi" in df.columns and df["rssi"].notna().any()
-        has_messages = "messages" in df.columns and df["messages"].notna().any()
-        has_distance = "r_dst" in df.columns and df["r_dst"].notna().any()
+        has_rssi = self._has_column("rssi")
+        has_messages = self._has_column("messages")
+        has_distance = self._has_column("r_dst")
 
         if not has_rssi and not has_messages:
             return None
@@ -140,10 +144,11 @@ class SignalChart(BaseChart):
 
         # RSSI
         if has_rssi:
+            times, rssi = self._trace("rssi")
             fig.add_trace(
-                go.Scatter(
-                    x=df["datetime"],
-                    y=df["rssi"],
+                go.Scattergl(
+                    x=times,
+                    y=rssi,
                     name="RSSI",
                     fill="tozeroy",
                     fillcolor="rgba(0, 100, 255, 0.3)",
@@ -165,10 +170,11 @@ class SignalChart(BaseChart):
         # Messages and distance
         if has_messages or has_distance:
             if has_messages:
+                times, messages = self._trace("messages")
                 fig.add_trace(
-                    go.Scatter(
-                        x=df["datetime"],
-                        y=df["messages"],
+                    go.Scattergl(
+                        x=times,
+                        y=messages,
                         name="Messages",
                         line=dict(color="green", width=1.5),
                         hovertemplate="<b>%{y} msgs</b><extra></extra>"
@@ -178,10 +184,11 @@ class SignalChart(BaseChart):
                 fig.update_yaxes(title_text="Message Count", row=row_idx, col=1, secondary_y=False)
 
             if has_distance:
+                times, distance = self._trace("r_dst")
                 fig.add_trace(
-                    go.Scatter(
-                        x=df["datetime"],
-                        y=df["r_dst"],
+                    go.Scattergl(
+                        x=times,
+                        y=distance,
                         name="Distance",
                         line=dict(color="magenta", width=1.5),
                         hovertemplate="<b>%{y:.1f} nm</b><extra></extra>"
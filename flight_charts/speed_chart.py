@@ -25,6 +25,8 @@ class SpeedChart(BaseChart):
     - Mach number (secondary axis)
     """
 
+    REQUIRED_ANY_COLS = ("gs", "ias", "tas")
+
     @property
     def name(self) -> str:
         return "speed_profile"
@@ -34,7 +36,7 @@ class SpeedChart(BaseChart):
         return f"{self.callsign} - Speed Profile"
 
     def _create_matplotlib_figure(self) -> Optional['plt.Figure']:
-        if not HAS_MATPLOTLIB or self.df is None:
+        if not HAS_MATPLOTLIB or self.df is None or self.df.empty:
             return None
 
         df = self.df
@@ -42,26 +44,26 @@ class SpeedChart(BaseChart):
         if "datetime" not in df.columns:
             return None
 
-        has_gs = "gs" in df.columns and df["gs"].notna().any()
-        has_ias = "ias" in df.columns and df["ias"].notna().any()
-        has_tas = "tas" in df.columns and df["tas"].notna().any()
-        has_mach = "mach" in df.columns and df["mach"].notna().any()
+        has_gs = self._has_column("gs")
+        has_ias = self._has_column("ias")
+        has_tas = self._has_column("tas")
+        has_mach = self._has_column("mach")
 
         if not any([has_gs, has_ias, has_tas]):
             log.warning("No speed data for chart")
             return None
 
-        fig, ax1 = plt.subplots(1, 1, figsize=(12, 5))
+        fig, ax1 = plt.subplots(1, 1, figsize=(12, 5), constrained_layout=True)
 
         # Speed traces
         if has_gs:
-            ax1.plot(df["datetime"], df["gs"], "b-", linewidth=1.5,
+            ax1.plot(*self._trace("gs"), "b-", linewidth=1.5,
                     label="Ground Speed", alpha=0.9)
         if has_ias:
-            ax1.plot(df["datetime"], df["ias"], "g-", linewidth=1.5,
+            ax1.plot(*self._trace("ias"), "g-", linewidth=1.5,
                     label="IAS", alpha=0.8)
         if has_tas:
-            ax1.plot(df["datetime"], df["tas"], "r--", linewidth=1,
+            ax1.plot(*self._trace("tas"), "r--", linewidth=1,
                     label="TAS", alpha=0.7)
 
         ax1.set_ylabel("Speed (kts)")
@@ -72,7 +74,7 @@ class SpeedChart(BaseChart):
         # Mach on secondary axis
         if has_mach:
             ax2 = ax1.twinx()
-            ax2.plot(df["datetime"], df["mach"], "m:", linewidth=1.5,
+            ax2.plot(*self._trace("mach"), "m:", linewidth=1.5,
                     label="Mach", alpha=0.7)
             ax2.set_ylabel("Mach", color="magenta")
             ax2.tick_params(axis="y", labelcolor="magenta")
@@ -85,11 +87,10 @@ class SpeedChart(BaseChart):
             ax1.legend(loc="upper right")
 
         self._format_time_axis(ax1)
-        plt.tight_layout()
         return fig
 
     def _create_plotly_figure(self) -> Optional['go.Figure']:
-        if not HAS_PLOTLY or self.df is None:
+        if not HAS_PLOTLY or self.df is None or self.df.empty:
             return None
 
         df = self.df
@@ -97,10 +98,10 @@ class SpeedChart(BaseChart):
         if "datetime" not in df.columns:
             return None
 
-        has_gs = "gs" in df.columns and df["gs"].notna().any()
-        has_ias = "ias" in df.columns and df["ias"].notna().any()
-        has_tas = "tas" in df.columns and df["tas"].notna().any()
-        has_mach = "mach" in df.columns and df["mach"].notna().any()
+        has_gs = self._has_column("gs")
+        has_ias = self._has_column("ias")
+        has_tas = self._has_column("tas")
+        has_mach = self._has_column("mach")
 
         if not any([has_gs, has_ias, has_tas]):
             return None
@@ -110,10 +111,11 @@ class SpeedChart(BaseChart):
 
         # Speed traces
         if has_gs:
+            times, values = self._trace("gs")
             fig.add_trace(
-                go.Scatter(
-                    x=df["datetime"],
-                    y=df["gs"],
+                go.Scattergl(
+                    x=times,
+                    y=values,
                     name="Ground Speed",
                     line=dict(color="blue", width=2),
                     hovertemplate="<b>GS: %{y:.0f} kts</b><extra></extra>"
@@ -122,10 +124,11 @@ class SpeedChart(BaseChart):
             )
 
         if has_ias:
+            times, values = self._trace("ias")
             fig.add_trace(
-                go.Scatter(
-                    x=df["datetime"],
-                    y=df["ias"],
+                go.Scattergl(
+                    x=times,
+                    y=values,
                     name="IAS",
                     line=dict(color="green", width=2),
                     hovertemplate="<b>IAS: %{y:.0f} kts</b><extra></extra>"
@@ -134,10 +137,11 @@ class SpeedChart(BaseChart):
             )
 
         if has_tas:
+            times, values = self._trace("tas")
             fig.add_trace(
-                go.Scatter(
-                    x=df["datetime"],
-                    y=df["tas"],
+                go.Scattergl(
+                    x=times,
+                    y=values,
                     name="TAS",
                     line=dict(color="red", width=1, dash="dash"),
                     hovertemplate="<b>TAS: %{y:.0f} kts</b><extra></extra>"
@@ -146,10 +150,11 @@ class SpeedChart(BaseChart):
             )
 
         if has_mach:
+            times, values = self._trace("mach")
             fig.add_trace(
-                go.Scatter(
-                    x=df["datetime"],
-                    y=df["mach"],
+                go.Scattergl(
+                    x=times,
+                    y=values,
                     name="Mach",
                     line=dict(color="magenta", width=2, dash="dot"),
                     hovertemplate="<b>M%{y:.3f}</b><extra></extra>"
@@ -1,10 +1,13 @@
 """Ground track map visualization."""
 import logging
+import math
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, Tuple
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-from .base import BaseChart, HAS_MATPLOTLIB, HAS_PLOTLY
+from .base import BaseChart, HAS_MATPLOTLIB, HAS_PLOTLY, HAS_NUMBA, NUMBA_MIN_POINTS, lazy_njit
 
 if HAS_MATPLOTLIB:
     import matplotlib.pyplot as plt
@@ -16,6 +19,26 @@ if HAS_PLOTLY:
 
 log = logging.getLogger(__name__)
 
+# Earth radius in nautical miles
+EARTH_RADIUS_NM = 3440.065
+
+# Opacity of the altitude-colored track line (and its colorbar)
+TRACK_LINE_ALPHA = 0.8
+
+
+@lazy_njit(fastmath=True, cache=True)
+def _haversine_total_nm(lat, lon):
+    """Sum of haversine segment lengths in one pass, without temporaries."""
+    total = 0.0
+    for i in range(len(lat) - 1):
+        lat1 = math.radians(lat[i])
+        lat2 = math.radians(lat[i + 1])
+        dlat = lat2 - lat1
+        dlon = math.radians(lon[i + 1] - lon[i])
+        a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+        total += 2 * math.asin(math.sqrt(a))
+    return EARTH_RADIUS_NM * total
+
 
 class TrackMapChart(BaseChart):
     """
@@ -28,6 +51,8 @@ class TrackMapChart(BaseChart):
     - Distance scale
     """
 
+    REQUIRED_ANY_COLS = ("lat", "lon")
+
     @property
     def name(self) -> str:
         return "ground_track"
@@ -36,53 +61,73 @@ class TrackMapChart(BaseChart):
     def title(self) -> str:
         return f"{self.callsign} - Ground Track"
 
+    @cached_property
+    def _positions(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(lat, lon, alt) arrays for rows with a valid position; missing altitude is 0."""
+        df = self.df
+        lat = df["lat"].to_numpy(dtype=float)
+        lon = df["lon"].to_numpy(dtype=float)
+        mask = ~(np.isnan(lat) | np.isnan(lon))
+
+        if "alt_baro" in df.columns:
+            alt = np.nan_to_num(df["alt_baro"].to_numpy(dtype=float)[mask], nan=0.0)
+        else:
+            alt = np.zeros(int(mask.sum()))
+
+        return lat[mask], lon[mask], alt
+
+    @cached_property
+    def _extent(self) -> Tuple[float, float, float, float, float, float, int]:
+        """
+        Bounds of the valid positions, computed once for both backends.
+
+        Returns:
+            (lat_min, lat_max, lon_min, lon_max, alt_min, alt_max, max_alt_idx)
+        """
+        lat, lon, alt = self._positions
+        max_alt_idx = int(np.argmax(alt))
+        return (lat.min(), lat.max(), lon.min(), lon.max(),
+                alt.min(), alt[max_alt_idx], max_alt_idx)
+
     def _create_matplotlib_figure(self) -> Optional['plt.Figure']:
-        if not HAS_MATPLOTLIB or self.df is None:
+        if not HAS_MATPLOTLIB or self.df is None or self.df.empty:
             return None
 
-        df = self.df
-
-        has_lat = "lat" in df.columns and df["lat"].notna().any()
-        has_lon = "lon" in df.columns and df["lon"].notna().any()
+        has_lat = self._has_column("lat")
+        has_lon = self._has_column("lon")
 
         if not has_lat or not has_lon:
             log.warning("No position data for track map")
             return None
 
-        # Filter to rows with valid positions
-        mask = df["lat"].notna() & df["lon"].notna()
-        df_pos = df[mask].copy()
-
-        if len(df_pos) < 2:
+        lat, lon, alt = self._positions
+        if len(lat) < 2:
             return None
+        lat_min, lat_max, lon_min, lon_max, alt_min, alt_max, max_alt_idx = self._extent
 
-        lat = df_pos["lat"].values
-        lon = df_pos["lon"].values
-
-        # Get altitude for coloring
-        if "alt_baro" in df_pos.columns:
-            alt = df_pos["alt_baro"].fillna(0).values
-        else:
-            alt = np.zeros(len(df_pos))
-
-        fig, ax = plt.subplots(1, 1, figsize=(10, 10))
+        fig, ax = plt.subplots(1, 1, figsize=(10, 10), constrained_layout=True)
 
-        # Create line segments colored by altitude
-        points = np.array([lon, lat]).T.reshape(-1, 1, 2)
-        segments = np.concatenate([points[:-1], points[1:]], axis=1)
+        # Create line segments colored by altitude: (N-1, 2, 2) view of
+        # consecutive (lon, lat) pairs, without copying the coordinates
+        coords = np.column_stack([lon, lat])
+        segments = sliding_window_view(coords, (2, 2))[:, 0]
 
         # Normalize altitude for colormap
-        alt_min, alt_max = alt.min(), alt.max()
         if alt_max == alt_min:
             alt_max = alt_min + 1
 
         norm = Normalize(vmin=alt_min, vmax=alt_max)
-        lc = LineCollection(segments, cmap='plasma', norm=norm, linewidth=2, alpha=0.8)
-        lc.set_array(alt[:-1])
+        cmap = plt.get_cmap('plasma')
+
+        # Map altitudes to RGBA once instead of per draw via set_array
+        colors = cmap(norm(alt[:-1]))
+        lc = LineCollection(segments, colors=colors, linewidth=2, alpha=TRACK_LINE_ALPHA,
+                            rasterized=True)
         ax.add_collection(lc)
 
-        # Add colorbar
-        cbar = plt.colorbar(lc, ax=ax, shrink=0.8, pad=0.02)
+        # Add colorbar, with the line's transparency so the colors match
+        cbar = plt.colorbar(cm.ScalarMappable(norm=norm, cmap=cmap), ax=ax, shrink=0.8, pad=0.02,
+                            alpha=TRACK_LINE_ALPHA)
         cbar.set_label('Altitude (ft)')
 
         # Mark start and end
@@ -90,17 +135,16 @@ class TrackMapChart(BaseChart):
         ax.plot(lon[-1], lat[-1], 'ro', markersize=12, label='End', zorder=5)
 
         # Mark max altitude point
-        max_alt_idx = np.argmax(alt)
         ax.plot(lon[max_alt_idx], lat[max_alt_idx], 'b^', markersize=10,
                label=f'Max Alt ({alt[max_alt_idx]:.0f} ft)', zorder=5)
 
         # Set axis limits with padding
-        lon_range = lon.max() - lon.min()
-        lat_range = lat.max() - lat.min()
+        lon_range = lon_max - lon_min
+        lat_range = lat_max - lat_min
         padding = max(lon_range, lat_range) * 0.1
 
-        ax.set_xlim(lon.min() - padding, lon.max() + padding)
-        ax.set_ylim(lat.min() - padding, lat.max() + padding)
+        ax.set_xlim(lon_min - padding, lon_max + padding)
+        ax.set_ylim(lat_min - padding, lat_max + padding)
 
         # Equal aspect ratio
         ax.set_aspect('equal')
@@ -118,47 +162,33 @@ class TrackMapChart(BaseChart):
                verticalalignment='bottom',
                bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
 
-        plt.tight_layout()
         return fig
 
     def _create_plotly_figure(self) -> Optional['go.Figure']:
-        if not HAS_PLOTLY or self.df is None:
+        if not HAS_PLOTLY or self.df is None or self.df.empty:
             return None
 
-        df = self.df
-
-        has_lat = "lat" in df.columns and df["lat"].notna().any()
-        has_lon = "lon" in df.columns and df["lon"].notna().any()
+        has_lat = self._has_column("lat")
+        has_lon = self._has_column("lon")
 
         if not has_lat or not has_lon:
             return None
 
-        # Filter to rows with valid positions
-        mask = df["lat"].notna() & df["lon"].notna()
-        df_pos = df[mask].copy()
-
-        if len(df_pos) < 2:
+        lat, lon, alt = self._positions
+        if len(lat) < 2:
             return None
-
-        lat = df_pos["lat"].values
-        lon = df_pos["lon"].values
-
-        # Get altitude for coloring
-        if "alt_baro" in df_pos.columns:
-            alt = df_pos["alt_baro"].fillna(0).values
-        else:
-            alt = np.zeros(len(df_pos))
+        lat_min, lat_max, lon_min, lon_max, _, _, max_alt_idx = self._extent
 
         fig = go.Figure()
 
         # Main track colored by altitude
         fig.add_trace(go.Scattergeo(
-            lon=lon,
-            lat=lat,
+            lon=lon.astype(np.float32),
+            lat=lat.astype(np.float32),
             mode='lines+markers',
             marker=dict(
                 size=4,
-                color=alt,
+                color=alt.astype(np.float32),
                 colorscale='Plasma',
                 colorbar=dict(title='Altitude (ft)'),
                 showscale=True
@@ -189,7 +219,6 @@ class TrackMapChart(BaseChart):
         ))
 
         # Max altitude marker
-        max_alt_idx = np.argmax(alt)
         fig.add_trace(go.Scattergeo(
             lon=[lon[max_alt_idx]],
             lat=[lat[max_alt_idx]],
@@ -200,8 +229,8 @@ class TrackMapChart(BaseChart):
         ))
 
         # Calculate bounds
-        lat_center = (lat.min() + lat.max()) / 2
-        lon_center = (lon.min() + lon.max()) / 2
+        lat_center = (lat_min + lat_max) / 2
+        lon_center = (lon_min + lon_max) / 2
 
         fig.update_layout(
             title=self.title,
@@ -216,8 +245,8 @@ class TrackMapChart(BaseChart):
                 lakecolor='rgb(200, 230, 255)',
                 showcountries=True,
                 center=dict(lat=lat_center, lon=lon_center),
-                lonaxis=dict(range=[lon.min() - 1, lon.max() + 1]),
-                lataxis=dict(range=[lat.min() - 1, lat.max() + 1]),
+                lonaxis=dict(range=[lon_min - 1, lon_max + 1]),
+                lataxis=dict(range=[lat_min - 1, lat_max + 1]),
             ),
             height=600,
             showlegend=True,
@@ -228,20 +257,17 @@ class TrackMapChart(BaseChart):
 
     def _calculate_distance(self, lat: np.ndarray, lon: np.ndarray) -> float:
         """Calculate total distance in nautical miles using haversine formula."""
-        total_nm = 0.0
-
-        for i in range(len(lat) - 1):
-            lat1, lon1 = np.radians(lat[i]), np.radians(lon[i])
-            lat2, lon2 = np.radians(lat[i+1]), np.radians(lon[i+1])
-
-            dlat = lat2 - lat1
-            dlon = lon2 - lon1
+        if HAS_NUMBA and len(lat) >= NUMBA_MIN_POINTS:
+            return float(_haversine_total_nm(np.ascontiguousarray(lat, dtype=np.float64),
+                                             np.ascontiguousarray(lon, dtype=np.float64)))
 
-            a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-            c = 2 * np.arcsin(np.sqrt(a))
+        # All segments at once: consecutive fixes are the segment endpoints
+        lat_r = np.radians(lat)
+        lon_r = np.radians(lon)
+        dlat = np.diff(lat_r)
+        dlon = np.diff(lon_r)
 
-            # Earth radius in nautical miles
-            r_nm = 3440.065
-            total_nm += r_nm * c
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat_r[:-1]) * np.cos(lat_r[1:]) * np.sin(dlon / 2) ** 2
+        c = 2 * np.arcsin(np.sqrt(a))
 
-        return total_nm
+        return float(EARTH_RADIUS_NM * c.sum())
@@ -2,12 +2,12 @@
 import logging
 from pathlib import Path
 from typing import Optional
+import numpy as np
 
 from .base import BaseChart, HAS_MATPLOTLIB, HAS_PLOTLY
 
 if HAS_MATPLOTLIB:
     import matplotlib.pyplot as plt
-    import numpy as np
 if HAS_PLOTLY:
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
@@ -25,6 +25,8 @@ class VerticalRateChart(BaseChart):
     - Phase transition markers
     """
 
+    REQUIRED_ANY_COLS = ("baro_rate", "geom_rate")
+
     @property
     def name(self) -> str:
         return "vertical_rate"
@@ -34,7 +36,7 @@ class VerticalRateChart(BaseChart):
         return f"{self.callsign} - Vertical Rate"
 
     def _create_matplotlib_figure(self) -> Optional['plt.Figure']:
-        if not HAS_MATPLOTLIB or self.df is None:
+        if not HAS_MATPLOTLIB or self.df is None or self.df.empty:
             return None
 
         df = self.df
@@ -42,29 +44,29 @@ class VerticalRateChart(BaseChart):
         if "datetime" not in df.columns:
             return None
 
-        has_baro_rate = "baro_rate" in df.columns and df["baro_rate"].notna().any()
-        has_geom_rate = "geom_rate" in df.columns and df["geom_rate"].notna().any()
+        has_baro_rate = self._has_column("baro_rate")
+        has_geom_rate = self._has_column("geom_rate")
 
         if not has_baro_rate and not has_geom_rate:
             log.warning("No vertical rate data for chart")
             return None
 
-        fig, ax = plt.subplots(1, 1, figsize=(12, 5))
+        fig, ax = plt.subplots(1, 1, figsize=(12, 5), constrained_layout=True)
 
         if has_baro_rate:
-            vrate = df["baro_rate"].fillna(0)
+            times, vrate = self._trace("baro_rate", fill=0.0)
 
-            # Fill areas
-            ax.fill_between(df["datetime"], 0, vrate,
-                          where=vrate > 0, color="green", alpha=0.4, label="Climb")
-            ax.fill_between(df["datetime"], 0, vrate,
-                          where=vrate < 0, color="red", alpha=0.4, label="Descent")
+            # Fill areas, clipped up front rather than with where= masks
+            ax.fill_between(times, 0.0, np.maximum(vrate, 0.0),
+                          color="green", alpha=0.4, label="Climb", linewidth=0)
+            ax.fill_between(times, 0.0, np.minimum(vrate, 0.0),
+                          color="red", alpha=0.4, label="Descent", linewidth=0)
 
             # Line on top
-            ax.plot(df["datetime"], vrate, "b-", linewidth=1, alpha=0.7, label="Baro Rate")
+            ax.plot(times, vrate, "b-", linewidth=1, alpha=0.7, label="Baro Rate")
 
         if has_geom_rate:
-            ax.plot(df["datetime"], df["geom_rate"], "g--", linewidth=1,
+            ax.plot(*self._trace("geom_rate"), "g--", linewidth=1,
                    alpha=0.6, label="Geom Rate")
 
         ax.axhline(y=0, color="gray", linestyle="-", linewidth=1)
@@ -79,11 +81,10 @@ class VerticalRateChart(BaseChart):
         ax.axhline(y=-2000, color="gray", linestyle=":", linewidth=0.5, alpha=0.5)
 
         self._format_time_axis(ax)
-        plt.tight_layout()
         return fig
 
     def _create_plotly_figure(self) -> Optional['go.Figure']:
-        if not HAS_PLOTLY or self.df is None:
+        if not HAS_PLOTLY or self.df is None or self.df.empty:
             return None
 
         df = self.df
@@ -91,8 +92,8 @@ class VerticalRateChart(BaseChart):
         if "datetime" not in df.columns:
             return None
 
-        has_baro_rate = "baro_rate" in df.columns and df["baro_rate"].notna().any()
-        has_geom_rate = "geom_rate" in df.columns and df["geom_rate"].notna().any()
+        has_baro_rate = self._has_column("baro_rate")
+        has_geom_rate = self._has_column("geom_rate")
 
         if not has_baro_rate and not has_geom_rate:
             return None
@@ -100,13 +101,15 @@ class VerticalRateChart(BaseChart):
         fig = go.Figure()
 
         if has_baro_rate:
-            vrate = df["baro_rate"].fillna(0)
+            times, vrate = self._trace("baro_rate", fill=0.0)
+            climb = np.maximum(vrate, 0.0)
+            descent = np.minimum(vrate, 0.0)
 
             # Climb fill
             fig.add_trace(
-                go.Scatter(
-                    x=df["datetime"],
-                    y=vrate.where(vrate > 0, 0),
+                go.Scattergl(
+                    x=times,
+                    y=climb,
                     name="Climb",
                     fill="tozeroy",
                     fillcolor="rgba(0, 200, 0, 0.3)",
@@ -117,9 +120,9 @@ class VerticalRateChart(BaseChart):
 
             # Descent fill
             fig.add_trace(
-                go.Scatter(
-                    x=df["datetime"],
-                    y=vrate.where(vrate < 0, 0),
+                go.Scattergl(
+                    x=times,
+                    y=descent,
                     name="Descent",
                     fill="tozeroy",
                     fillcolor="rgba(200, 0, 0, 0.3)",
@@ -129,10 +132,11 @@ class VerticalRateChart(BaseChart):
             )
 
             # Main line
+            line_times, baro_rate = self._trace("baro_rate")
             fig.add_trace(
-                go.Scatter(
-                    x=df["datetime"],
-                    y=df["baro_rate"],
+                go.Scattergl(
+                    x=line_times,
+                    y=baro_rate,
                     name="Baro Rate",
                     line=dict(color="blue", width=1.5),
                     hovertemplate="<b>%{y:.0f} ft/min</b><extra></extra>"
@@ -140,10 +144,11 @@ class VerticalRateChart(BaseChart):
             )
 
         if has_geom_rate:
+            times, geom_rate = self._trace("geom_rate")
             fig.add_trace(
-                go.Scatter(
-                    x=df["datetime"],
-                    y=df["geom_rate"],
+                go.Scattergl(
+                    x=times,
+                    y=geom_rate,
                     name="Geom Rate",
                     line=dict(color="green", width=1, dash="dash"),
                     opacity=0.7,
@@ -8,6 +8,8 @@ from .base import BaseChart, HAS_MATPLOTLIB, HAS_PLOTLY
 
 if HAS_MATPLOTLIB:
     import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    from matplotlib.collections import LineCollection
 if HAS_PLOTLY:
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
@@ -22,11 +24,8 @@ def unwrap_angles(angles: np.ndarray) -> np.ndarray:
     This keeps the line continuous by adjusting values that jump
     more than 180 degrees.
     """
-    angles = np.array(angles, dtype=float)
-    # Convert to radians, unwrap, convert back to degrees
-    radians = np.deg2rad(angles)
-    unwrapped = np.unwrap(radians)
-    return np.rad2deg(unwrapped)
+    # Unwrap directly in degrees - no radian round trip
+    return np.unwrap(np.asarray(angles, dtype=float), period=360.0)
 
 
 def normalize_to_range(angles: np.ndarray, center: float = 180) -> np.ndarray:
@@ -41,32 +40,52 @@ def normalize_to_range(angles: np.ndarray, center: float = 180) -> np.ndarray:
     return angles
 
 
-def split_at_discontinuities(x, y, threshold=180):
+def wind_correction_angle(track: np.ndarray, heading: np.ndarray) -> np.ndarray:
     """
-    Split data into segments at discontinuities.
+    Signed difference between track and heading, wrapped to [-180, 180).
 
-    Returns list of (x_segment, y_segment) tuples.
+    Positive values mean the aircraft is crabbing right, negative left.
+    """
+    track = np.asarray(track, dtype=float)
+    heading = np.asarray(heading, dtype=float)
+    # Wrap in place: one result buffer instead of one per operator
+    wca = np.subtract(track, heading)
+    np.add(wca, 180.0, out=wca)
+    np.mod(wca, 360.0, out=wca)
+    np.subtract(wca, 180.0, out=wca)
+    return wca
+
+
+def find_breaks(y: np.ndarray, threshold: float = 180) -> np.ndarray:
+    """Indices where y jumps by more than threshold from the previous point."""
+    return np.flatnonzero(np.abs(np.diff(y)) > threshold) + 1
+
+
+def split_at_discontinuities(x, y, threshold=180):
     """
-    x = np.array(x)
-    y = np.array(y)
+    Split data into segments at discontinuities and missing values.
 
-    # Find discontinuities
-    diff = np.abs(np.diff(y))
-    breaks = np.where(diff > threshold)[0] + 1
+    NaN points are dropped rather than bridged, so a gap in the data
+    also ends the segment.
 
-    # Split into segments
-    segments = []
-    prev_idx = 0
-    for idx in breaks:
-        if idx - prev_idx > 1:  # Only add segments with more than 1 point
-            segments.append((x[prev_idx:idx], y[prev_idx:idx]))
-        prev_idx = idx
+    Returns list of (x_segment, y_segment) tuples.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
 
-    # Add final segment
-    if len(x) - prev_idx > 1:
-        segments.append((x[prev_idx:], y[prev_idx:]))
+    # Find discontinuities, treating both edges of every NaN as a break
+    missing = np.isnan(y)
+    breaks = np.flatnonzero(
+        (np.abs(np.diff(y)) > threshold) | missing[:-1] | missing[1:]
+    ) + 1
 
-    return segments
+    # Only keep segments with more than 1 point (this also drops the NaNs)
+    bounds = np.concatenate(([0], breaks, [len(y)]))
+    return [
+        (x[start:end], y[start:end])
+        for start, end in zip(bounds[:-1], bounds[1:])
+        if end - start > 1
+    ]
 
 
 class WindChart(BaseChart):
@@ -81,6 +100,8 @@ class WindChart(BaseChart):
     - Handles 0/360 wrap-around gracefully
     """
 
+    REQUIRED_ANY_COLS = ("track",)
+
     @property
     def name(self) -> str:
         return "wind_analysis"
@@ -90,19 +111,19 @@ class WindChart(BaseChart):
         return f"{self.callsign} - Wind Analysis (Track vs Heading)"
 
     def _create_matplotlib_figure(self) -> Optional['plt.Figure']:
-        if not HAS_MATPLOTLIB or self.df is None:
+        if not HAS_MATPLOTLIB or self.df is None or self.df.empty:
             return None
 
-        df = self.df.copy()
+        df = self.df
 
         if "datetime" not in df.columns:
             return None
 
-        has_track = "track" in df.columns and df["track"].notna().any()
-        has_true_heading = "true_heading" in df.columns and df["true_heading"].notna().any()
-        has_mag_heading = "mag_heading" in df.columns and df["mag_heading"].notna().any()
-        has_wind = "wd" in df.columns and df["wd"].notna().any()
-        has_wind_speed = "ws" in df.columns and df["ws"].notna().any()
+        has_track = self._has_column("track")
+        has_true_heading = self._has_column("true_heading")
+        has_mag_heading = self._has_column("mag_heading")
+        has_wind = self._has_column("wd")
+        has_wind_speed = self._has_column("ws")
 
         if not has_track:
             log.warning("No track data for wind chart")
@@ -111,26 +132,23 @@ class WindChart(BaseChart):
         # Create subplots
         if has_wind:
             fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True,
-                                           gridspec_kw={"height_ratios": [2, 1]})
+                                           gridspec_kw={"height_ratios": [2, 1]},
+                                           constrained_layout=True)
         else:
-            fig, ax1 = plt.subplots(1, 1, figsize=(12, 5))
+            fig, ax1 = plt.subplots(1, 1, figsize=(12, 5), constrained_layout=True)
             ax2 = None
 
         # Get heading data
         heading_col = "true_heading" if has_true_heading else ("mag_heading" if has_mag_heading else None)
 
         # Plot track - split at discontinuities to avoid ugly lines
-        track_segments = split_at_discontinuities(df["datetime"].values, df["track"].values)
-        for i, (x_seg, y_seg) in enumerate(track_segments):
-            ax1.plot(x_seg, y_seg, "b-", linewidth=1.5, alpha=0.9,
-                    label="Track" if i == 0 else None)
+        self._add_segments(ax1, "track", "Track", colors="blue",
+                           linewidths=1.5, alpha=0.9)
 
         # Plot heading
         if heading_col:
-            heading_segments = split_at_discontinuities(df["datetime"].values, df[heading_col].values)
-            for i, (x_seg, y_seg) in enumerate(heading_segments):
-                ax1.plot(x_seg, y_seg, "r--", linewidth=1.5, alpha=0.8,
-                        label="Heading" if i == 0 else None)
+            self._add_segments(ax1, heading_col, "Heading", colors="red",
+                               linestyles="--", linewidths=1.5, alpha=0.8)
 
         ax1.set_ylabel("Degrees")
         ax1.set_ylim(0, 360)
@@ -141,17 +159,11 @@ class WindChart(BaseChart):
 
         # Calculate and plot wind correction angle on secondary axis
         if heading_col:
-            heading = df[heading_col].values
-            track = df["track"].values
-
             # Calculate WCA (positive = crabbing right, negative = crabbing left)
-            wca = track - heading
-            # Normalize to -180 to +180
-            wca = np.where(wca > 180, wca - 360, wca)
-            wca = np.where(wca < -180, wca + 360, wca)
+            wca_times, wca = self._wca_trace(heading_col)
 
             ax1b = ax1.twinx()
-            ax1b.fill_between(df["datetime"], 0, wca, alpha=0.3, color="purple",
+            ax1b.fill_between(wca_times, 0, wca, alpha=0.3, color="purple",
                             where=~np.isnan(wca))
             ax1b.axhline(y=0, color="purple", linestyle="-", linewidth=0.5, alpha=0.5)
             ax1b.set_ylabel("Wind Correction Angle (°)", color="purple")
@@ -161,10 +173,7 @@ class WindChart(BaseChart):
         # Wind data subplot
         if ax2 is not None and has_wind:
             # Split wind direction at discontinuities too
-            wd_segments = split_at_discontinuities(df["datetime"].values, df["wd"].values)
-            for i, (x_seg, y_seg) in enumerate(wd_segments):
-                ax2.plot(x_seg, y_seg, "g-", linewidth=1.5,
-                        label="Wind Dir" if i == 0 else None)
+            self._add_segments(ax2, "wd", "Wind Dir", colors="green", linewidths=1.5)
 
             ax2.set_ylabel("Wind Direction (°)", color="green")
             ax2.tick_params(axis="y", labelcolor="green")
@@ -173,7 +182,7 @@ class WindChart(BaseChart):
 
             if has_wind_speed:
                 ax2b = ax2.twinx()
-                ax2b.plot(df["datetime"], df["ws"], "m-", linewidth=1.5, label="Wind Speed")
+                ax2b.plot(*self._trace("ws"), "m-", linewidth=1.5, label="Wind Speed")
                 ax2b.set_ylabel("Wind Speed (kts)", color="magenta")
                 ax2b.tick_params(axis="y", labelcolor="magenta")
                 ax2b.set_ylim(0, max(df["ws"].max() * 1.2, 50))
@@ -186,22 +195,21 @@ class WindChart(BaseChart):
             self._format_time_axis(ax1)
             ax1.set_xlabel("Time (UTC)")
 
-        plt.tight_layout()
         return fig
 
     def _create_plotly_figure(self) -> Optional['go.Figure']:
-        if not HAS_PLOTLY or self.df is None:
+        if not HAS_PLOTLY or self.df is None or self.df.empty:
             return None
 
-        df = self.df.copy()
+        df = self.df
 
         if "datetime" not in df.columns:
             return None
 
-        has_track = "track" in df.columns and df["track"].notna().any()
-        has_true_heading = "true_heading" in df.columns and df["true_heading"].notna().any()
-        has_mag_heading = "mag_heading" in df.columns and df["mag_heading"].notna().any()
-        has_wind = "wd" in df.columns and df["wd"].notna().any()
+        has_track = self._has_column("track")
+        has_true_heading = self._has_column("true_heading")
+        has_mag_heading = self._has_column("mag_heading")
+        has_wind = self._has_column("wd")
 
         if not has_track:
             return None
@@ -223,9 +231,9 @@ class WindChart(BaseChart):
             fig = make_subplots(specs=[[{"secondary_y": True}]])
 
         # Plot track - use None to break lines at discontinuities
-        track_with_breaks = self._insert_breaks(df["datetime"].values, df["track"].values)
+        track_with_breaks = self._insert_breaks(*self._trace("track"))
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=track_with_breaks[0],
                 y=track_with_breaks[1],
                 name="Track",
@@ -238,9 +246,9 @@ class WindChart(BaseChart):
 
         # Plot heading
         if heading_col:
-            hdg_with_breaks = self._insert_breaks(df["datetime"].values, df[heading_col].values)
+            hdg_with_breaks = self._insert_breaks(*self._trace(heading_col))
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=hdg_with_breaks[0],
                     y=hdg_with_breaks[1],
                     name="Heading",
@@ -252,15 +260,11 @@ class WindChart(BaseChart):
             )
 
             # Wind correction angle
-            heading = df[heading_col].values
-            track = df["track"].values
-            wca = track - heading
-            wca = np.where(wca > 180, wca - 360, wca)
-            wca = np.where(wca < -180, wca + 360, wca)
+            wca_times, wca = self._wca_trace(heading_col)
 
             fig.add_trace(
-                go.Scatter(
-                    x=df["datetime"],
+                go.Scattergl(
+                    x=wca_times,
                     y=wca,
                     name="Wind Correction",
                     fill="tozeroy",
@@ -273,9 +277,9 @@ class WindChart(BaseChart):
 
         # Wind data
         if has_wind:
-            wd_with_breaks = self._insert_breaks(df["datetime"].values, df["wd"].values)
+            wd_with_breaks = self._insert_breaks(*self._trace("wd"))
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=wd_with_breaks[0],
                     y=wd_with_breaks[1],
                     name="Wind Direction",
@@ -286,11 +290,12 @@ class WindChart(BaseChart):
                 row=2, col=1, secondary_y=False
             )
 
-            if "ws" in df.columns and df["ws"].notna().any():
+            if self._has_column("ws"):
+                ws_times, ws = self._trace("ws")
                 fig.add_trace(
-                    go.Scatter(
-                        x=df["datetime"],
-                        y=df["ws"],
+                    go.Scattergl(
+                        x=ws_times,
+                        y=ws,
                         name="Wind Speed",
                         line=dict(color="magenta", width=2),
                         hovertemplate="<b>WS: %{y:.0f} kts</b><extra></extra>"
@@ -319,24 +324,32 @@ class WindChart(BaseChart):
 
         return fig
 
+    def _add_segments(self, ax, col: str, label: str, **line_kw):
+        """Draw an angle trace as one LineCollection, split at the 0/360 wrap."""
+        times, values = self._trace(col)
+        segments = [np.column_stack((x_seg, y_seg)) for x_seg, y_seg
+                    in split_at_discontinuities(mdates.date2num(times), values)]
+        ax.add_collection(LineCollection(segments, label=label, **line_kw))
+        ax.autoscale_view(scaley=False)
+
+    def _wca_trace(self, heading_col: str):
+        """Downsampled (times, wind correction angle), shared by both figures."""
+        key = ("wca", heading_col)
+        if key not in self._traces:
+            wca = wind_correction_angle(self.df["track"].to_numpy(dtype=float),
+                                        self.df[heading_col].to_numpy(dtype=float))
+            self._traces[key] = self._downsample(self._times, wca)
+        return self._traces[key]
+
     def _insert_breaks(self, x, y, threshold=180):
-        """Insert None values at discontinuities to break the line."""
-        x = list(x)
-        y = list(y)
-
-        new_x = []
-        new_y = []
-
-        for i in range(len(y)):
-            new_x.append(x[i])
-            new_y.append(y[i])
-
-            if i < len(y) - 1:
-                # Check for discontinuity
-                if y[i] is not None and y[i+1] is not None:
-                    diff = abs(float(y[i+1]) - float(y[i]))
-                    if diff > threshold:
-                        new_x.append(None)
-                        new_y.append(None)
-
-        return new_x, new_y
+        """Insert NaN gaps at discontinuities to break the line."""
+        x = np.asarray(x)
+        y = np.asarray(y, dtype=float)
+
+        breaks = find_breaks(y, threshold)
+        if not len(breaks):
+            return x, y
+
+        # Repeat the timestamp of the point after each break; the NaN y value
+        # is what makes Plotly lift the pen (connectgaps=False).
+        return np.insert(x, breaks, x[breaks]), np.insert(y, breaks, np.nan)
@@ -2,7 +2,7 @@
 import csv
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from flight_extractor.config import CSV_COLUMN_ORDER, CSV_COLUMN_GROUPS
 
@@ -37,7 +37,7 @@ class CSVExporter:
 
     def export(
         self,
-        records: List[dict],
+        records: Iterable[dict],
         output_path: Path,
         include_header_comments: bool = True
     ) -> Path:
@@ -45,13 +45,16 @@ class CSVExporter:
         Export records to CSV file.
 
         Args:
-            records: List of flight data records
+            records: Flight data records. Any iterable is accepted; it is
+                read into a list first to find the used columns.
             output_path: Path to output CSV file
             include_header_comments: Whether to include column group comments
 
         Returns:
             Path to created CSV file
         """
+        if not isinstance(records, list):
+            records = list(records)
         if not records:
             log.warning("No records to export")
             return output_path
@@ -63,7 +66,7 @@ class CSVExporter:
         columns = [c for c in self.column_order if c in used_columns]
 
         # Add any extra columns not in our predefined order
-        extra_cols = used_columns - set(columns)
+        extra_cols = used_columns.difference(self.column_order)
         columns.extend(sorted(extra_cols))
 
         log.info(f"Exporting {len(records)} records with {len(columns)} columns to {output_path}")
@@ -72,17 +75,9 @@ class CSVExporter:
             if include_header_comments:
                 f.write(self._generate_header_comments())
 
-            writer = csv.DictWriter(
-                f,
-                fieldnames=columns,
-                extrasaction="ignore"
-            )
-            writer.writeheader()
-
-            for record in records:
-                # Clean up the record for CSV output
-                clean_record = self._clean_record(record)
-                writer.writerow(clean_record)
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(self._clean_rows(records, columns))
 
         log.info(f"CSV export complete: {output_path}")
         return output_path
@@ -91,24 +86,25 @@ class CSVExporter:
         """Find all columns that have at least one non-null value."""
         used = set()
         for record in records:
-            for key, value in record.items():
+            # Only look at keys not already known to be used
+            for key in record.keys() - used:
+                value = record[key]
                 if value is not None and value != "":
                     used.add(key)
         return used
 
-    def _clean_record(self, record: dict) -> dict:
-        """Clean a record for CSV output."""
-        clean = {}
-        for key, value in record.items():
-            if value is None:
-                clean[key] = ""
-            elif isinstance(value, bool):
-                clean[key] = "1" if value else "0"
-            elif isinstance(value, (list, dict)):
-                clean[key] = str(value)
-            else:
-                clean[key] = value
-        return clean
+    def _clean_rows(self, records: Iterable[dict], columns: List[str]) -> Iterator[list]:
+        """
+        Yield one CSV row per record, in column order.
+
+        The csv writer already writes None as an empty field and str()s
+        lists and dicts, so only bools need converting (to 1/0).
+        """
+        for record in records:
+            yield [
+                ("1" if value else "0") if value.__class__ is bool else value
+                for value in map(record.get, columns)
+            ]
 
     def _generate_header_comments(self) -> str:
         """Generate header comments explaining column groups."""
@@ -126,7 +122,7 @@ class CSVExporter:
 
     def export_minimal(
         self,
-        records: List[dict],
+        records: Iterable[dict],
         output_path: Path
     ) -> Path:
         """
@@ -145,15 +141,8 @@ class CSVExporter:
         ]
 
         with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=minimal_columns,
-                extrasaction="ignore"
-            )
-            writer.writeheader()
-
-            for record in records:
-                clean_record = self._clean_record(record)
-                writer.writerow(clean_record)
+            writer = csv.writer(f)
+            writer.writerow(minimal_columns)
+            writer.writerows(self._clean_rows(records, minimal_columns))
 
         return output_path
@@ -1,14 +1,13 @@
 """Generate KML flight paths for Google Earth."""
+import importlib.util
 import logging
+from bisect import bisect_right
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-try:
-    import simplekml
-    HAS_SIMPLEKML = True
-except ImportError:
-    HAS_SIMPLEKML = False
+# simplekml is imported on first use; only check that it is installed here
+HAS_SIMPLEKML = importlib.util.find_spec("simplekml") is not None
 
 from flight_extractor.config import KML_ALTITUDE_COLORS
 
@@ -35,6 +34,7 @@ class KMLGenerator:
         (40000, "ffff7f00"),   # Cyan: 30k-40k
         (50000, "ffff0000"),   # Blue: 40k+
     ]
+    _ALTITUDE_THRESHOLDS, _ALTITUDE_BAND_COLORS = map(list, zip(*ALTITUDE_COLORS))
 
     def __init__(self):
         if not HAS_SIMPLEKML:
@@ -59,12 +59,23 @@ class KMLGenerator:
         Returns:
             Path to created KML file
         """
-        # Filter records with valid positions
-        positioned = [
+        return self._generate_positioned(self._positioned(records), output_path, callsign, flight_date)
+
+    def _positioned(self, records: List[dict]) -> List[dict]:
+        """Filter records with valid positions."""
+        return [
             r for r in records
             if r.get("lat") is not None and r.get("lon") is not None
         ]
 
+    def _generate_positioned(
+        self,
+        positioned: List[dict],
+        output_path: Path,
+        callsign: str,
+        flight_date: Optional[str]
+    ) -> Path:
+        """Generate the single-path KML from already position-filtered records."""
         if not positioned:
             log.warning("No positioned records for KML generation")
             return output_path
@@ -84,6 +95,8 @@ class KMLGenerator:
         flight_date: Optional[str]
     ) -> Path:
         """Generate KML using simplekml library."""
+        import simplekml
+
         kml = simplekml.Kml()
 
         title = f"{callsign}"
@@ -98,12 +111,11 @@ class KMLGenerator:
         line_style.linestyle.color = simplekml.Color.cyan
 
         # Build coordinate list
-        coords = []
-        for r in records:
-            lat = r.get("lat")
-            lon = r.get("lon")
-            alt = self._get_altitude_meters(r)
-            coords.append((lon, lat, alt))
+        alts_ft = self._altitudes_ft(records)
+        coords = [
+            (r["lon"], r["lat"], alt_ft * 0.3048)
+            for r, alt_ft in zip(records, alts_ft)
+        ]
 
         # Create the flight path line
         linestring = kml.newlinestring(name="Flight Path")
@@ -132,13 +144,15 @@ class KMLGenerator:
             end_point.description = f"Time: {end['_ts_iso']}"
 
         # Add max altitude point
-        max_alt_record = max(records, key=lambda r: self._get_altitude_ft(r) or 0)
-        if self._get_altitude_ft(max_alt_record):
-            max_point = kml.newpoint(name=f"Max Alt: {self._get_altitude_ft(max_alt_record):.0f} ft")
+        max_idx = max(range(len(alts_ft)), key=alts_ft.__getitem__)
+        max_alt_ft = alts_ft[max_idx]
+        if max_alt_ft:
+            max_alt_record = records[max_idx]
+            max_point = kml.newpoint(name=f"Max Alt: {max_alt_ft:.0f} ft")
             max_point.coords = [(
                 max_alt_record["lon"],
                 max_alt_record["lat"],
-                self._get_altitude_meters(max_alt_record)
+                max_alt_ft * 0.3048
             )]
             max_point.style.iconstyle.icon.href = "http://maps.google.com/mapfiles/kml/paddle/blu-circle.png"
             max_point.style.iconstyle.scale = 0.8
@@ -159,21 +173,19 @@ class KMLGenerator:
         if flight_date:
             title += f" - {flight_date}"
 
-        # Build coordinates string
-        coords_lines = []
-        for r in records:
-            lat = r.get("lat")
-            lon = r.get("lon")
-            alt = self._get_altitude_meters(r)
-            coords_lines.append(f"{lon},{lat},{alt}")
-
-        coords_str = " ".join(coords_lines)
+        # Build coordinates string (records are pre-filtered to have lat/lon)
+        coords_str = " ".join([
+            f"{r['lon']},{r['lat']},{alt_ft * 0.3048}"
+            for r, alt_ft in zip(records, self._altitudes_ft(records))
+        ])
 
         # Start and end points
         start = records[0]
         end = records[-1]
 
-        kml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+        # The document is written in three pieces so the (large) coordinate
+        # string is never copied into one combined str
+        head = f'''<?xml version="1.0" encoding="UTF-8"?>
 <kml xmlns="http://www.opengis.net/kml/2.2">
   <Document>
     <name>{title}</name>
@@ -199,7 +211,8 @@ class KMLGenerator:
       <styleUrl>#flightPath</styleUrl>
       <LineString>
         <altitudeMode>absolute</altitudeMode>
-        <coordinates>{coords_str}</coordinates>
+        <coordinates>'''
+        tail = f'''</coordinates>
       </LineString>
     </Placemark>
 
@@ -226,8 +239,10 @@ class KMLGenerator:
   </Document>
 </kml>'''
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(kml_content)
+        with open(output_path, "wb") as f:
+            f.write(head.encode("utf-8"))
+            f.write(coords_str.encode("utf-8"))
+            f.write(tail.encode("utf-8"))
 
         log.info(f"KML saved to {output_path} (fallback method)")
         return output_path
@@ -235,6 +250,9 @@ class KMLGenerator:
     def _get_altitude_ft(self, record: dict) -> Optional[float]:
         """Get altitude in feet from record."""
         alt = record.get("alt_baro")
+        # readsb reports numeric altitudes as plain ints/floats
+        if type(alt) is int or type(alt) is float:
+            return float(alt)
         if alt is None or alt == "ground":
             return 0
         try:
@@ -242,6 +260,11 @@ class KMLGenerator:
         except (ValueError, TypeError):
             return 0
 
+    def _altitudes_ft(self, records: List[dict]) -> List[float]:
+        """Altitude in feet for every record, 0 where missing or on the ground."""
+        get_ft = self._get_altitude_ft
+        return [get_ft(r) or 0 for r in records]
+
     def _get_altitude_meters(self, record: dict) -> float:
         """Get altitude in meters from record (KML uses meters)."""
         alt_ft = self._get_altitude_ft(record) or 0
@@ -249,10 +272,8 @@ class KMLGenerator:
 
     def altitude_to_color(self, altitude_ft: float) -> str:
         """Map altitude to KML color (aabbggrr format)."""
-        for threshold, color in reversed(self.ALTITUDE_COLORS):
-            if altitude_ft >= threshold:
-                return color
-        return self.ALTITUDE_COLORS[0][1]
+        band = bisect_right(self._ALTITUDE_THRESHOLDS, altitude_ft) - 1
+        return self._ALTITUDE_BAND_COLORS[max(band, 0)]
 
     def generate_segmented(
         self,
@@ -270,13 +291,12 @@ class KMLGenerator:
         if not HAS_SIMPLEKML:
             return self.generate(records, output_path, callsign, flight_date)
 
-        positioned = [
-            r for r in records
-            if r.get("lat") is not None and r.get("lon") is not None
-        ]
+        positioned = self._positioned(records)
 
         if len(positioned) < 2:
-            return self.generate(records, output_path, callsign, flight_date)
+            return self._generate_positioned(positioned, output_path, callsign, flight_date)
+
+        import simplekml
 
         kml = simplekml.Kml()
         title = f"{callsign}"
@@ -287,33 +307,30 @@ class KMLGenerator:
         # Create folder for path segments
         folder = kml.newfolder(name="Flight Path")
 
+        # Convert each point once; interior points are shared by two segments
+        alts_ft = self._altitudes_ft(positioned)
+        points = [
+            (r["lon"], r["lat"], alt_ft * 0.3048)
+            for r, alt_ft in zip(positioned, alts_ft)
+        ]
+
         # Create segments between points
         for i in range(len(positioned) - 1):
-            r1 = positioned[i]
-            r2 = positioned[i + 1]
-
-            alt1 = self._get_altitude_ft(r1) or 0
-            alt2 = self._get_altitude_ft(r2) or 0
-            avg_alt = (alt1 + alt2) / 2
+            avg_alt = (alts_ft[i] + alts_ft[i + 1]) / 2
 
             segment = folder.newlinestring()
-            segment.coords = [
-                (r1["lon"], r1["lat"], self._get_altitude_meters(r1)),
-                (r2["lon"], r2["lat"], self._get_altitude_meters(r2)),
-            ]
+            segment.coords = [points[i], points[i + 1]]
             segment.altitudemode = simplekml.AltitudeMode.absolute
             segment.style.linestyle.color = self.altitude_to_color(avg_alt)
             segment.style.linestyle.width = 3
 
         # Add start/end points (same as regular generate)
-        start = positioned[0]
         start_point = kml.newpoint(name="Start")
-        start_point.coords = [(start["lon"], start["lat"], self._get_altitude_meters(start))]
+        start_point.coords = [points[0]]
         start_point.style.iconstyle.icon.href = "http://maps.google.com/mapfiles/kml/paddle/grn-circle.png"
 
-        end = positioned[-1]
         end_point = kml.newpoint(name="End")
-        end_point.coords = [(end["lon"], end["lat"], self._get_altitude_meters(end))]
+        end_point.coords = [points[-1]]
         end_point.style.iconstyle.icon.href = "http://maps.google.com/mapfiles/kml/paddle/red-circle.png"
 
         kml.save(str(output_path))
@@ -1,6 +1,7 @@
 """Configuration for flight data extraction system."""
 import os
 import sys
+from itertools import chain
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
@@ -9,15 +10,21 @@ from typing import Dict, List, Optional
 if sys.platform == "win32":
     DEFAULT_LOG_DIR = Path(r"M:\Dropbox\ADSBPi-Base\raw")
     DEFAULT_OUTPUT_DIR = Path(r"M:\Dropbox\ADSBPi-Base\analyses")
+    DEFAULT_CACHE_DIR = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "adsb-logger"
 else:
     DEFAULT_LOG_DIR = Path("/opt/adsb-logs")
     DEFAULT_OUTPUT_DIR = Path("/opt/adsb-analyses")
+    DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "adsb-logger"
 
 # File naming patterns
 FILE_PREFIX = "adsb_state_"
 FILE_SUFFIX_JSONL = ".jsonl"
 FILE_SUFFIX_GZ = ".jsonl.gz"
 
+# Per-file callsign/hex index used to skip log files during scans
+SCAN_INDEX_DIRNAME = "scan_index"
+SCAN_INDEX_MAX_AGE_DAYS = 30  # Index files older than this are pruned
+
 # Midnight crossover settings
 MAX_CROSSOVER_HOURS = 6  # Max hours to look ahead/behind for continuing flight
 FLIGHT_GAP_THRESHOLD_SECONDS = 300  # 5 minutes - gap to consider flight ended
@@ -38,9 +45,7 @@ CSV_COLUMN_GROUPS: Dict[str, List[str]] = {
 }
 
 # Flattened column order for CSV export
-CSV_COLUMN_ORDER: List[str] = []
-for group_cols in CSV_COLUMN_GROUPS.values():
-    CSV_COLUMN_ORDER.extend(group_cols)
+CSV_COLUMN_ORDER: List[str] = list(chain.from_iterable(CSV_COLUMN_GROUPS.values()))
 
 # All fields that might appear in records (from adsb_logger.py KEEP_FIELDS + metadata)
 ALL_FIELDS = [
@@ -91,6 +96,7 @@ class Config:
 
     log_dir: Path = field(default_factory=lambda: DEFAULT_LOG_DIR)
     output_dir: Path = field(default_factory=lambda: DEFAULT_OUTPUT_DIR)
+    cache_dir: Path = field(default_factory=lambda: DEFAULT_CACHE_DIR)
 
     # Crossover detection
     max_crossover_hours: int = MAX_CROSSOVER_HOURS
@@ -103,6 +109,9 @@ class Config:
     chart_dpi: int = 150
     max_chart_points: int = 10000  # Decimate if more points
 
+    # Log scanning
+    use_scan_index: bool = True  # Cache callsign/hex sets per .jsonl.gz file
+
     # Telegram
     telegram_token: Optional[str] = None
     allowed_user_ids: List[int] = field(default_factory=list)
@@ -116,9 +125,9 @@ class Config:
             users_str = os.environ.get(TELEGRAM_ALLOWED_USERS_ENV, "")
             if users_str:
                 self.allowed_user_ids = [
-                    int(uid.strip())
-                    for uid in users_str.split(",")
-                    if uid.strip().isdigit()
+                    int(uid)
+                    for uid in map(str.strip, users_str.split(","))
+                    if uid.isdigit()
                 ]
 
     @classmethod
@@ -131,5 +140,7 @@ class Config:
             config.log_dir = Path(log_dir)
         if output_dir := os.environ.get("ADSB_OUTPUT_DIR"):
             config.output_dir = Path(output_dir)
+        if cache_dir := os.environ.get("ADSB_CACHE_DIR"):
+            config.cache_dir = Path(cache_dir)
 
         return config
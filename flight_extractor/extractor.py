@@ -1,8 +1,9 @@
 """Main flight data extraction orchestrator."""
 import json
 import logging
+import sys
 from dataclasses import dataclass, field
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -12,8 +13,11 @@ from .midnight_handler import MidnightCrossoverHandler
 
 log = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class FlightMetadata:
     """Metadata about an extracted flight."""
     callsign: str
@@ -44,7 +48,7 @@ class FlightMetadata:
     extraction_time_seconds: float = 0.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FlightData:
     """Complete extracted flight data."""
     metadata: FlightMetadata
@@ -53,28 +57,29 @@ class FlightData:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        m = self.metadata
         return {
-            "callsign": self.metadata.callsign,
-            "hex": self.metadata.hex_code,
-            "registration": self.metadata.registration,
-            "aircraft_type": self.metadata.aircraft_type,
-            "operator": self.metadata.operator,
+            "callsign": m.callsign,
+            "hex": m.hex_code,
+            "registration": m.registration,
+            "aircraft_type": m.aircraft_type,
+            "operator": m.operator,
             "extraction": {
-                "requested_date": self.metadata.requested_date.isoformat() if self.metadata.requested_date else None,
-                "actual_start": self.metadata.first_seen.isoformat() if self.metadata.first_seen else None,
-                "actual_end": self.metadata.last_seen.isoformat() if self.metadata.last_seen else None,
-                "crossover_detected": self.metadata.crossover_detected,
-                "files_scanned": self.metadata.files_scanned,
-                "records_extracted": self.metadata.records_extracted,
-                "extraction_time_seconds": round(self.metadata.extraction_time_seconds, 2),
+                "requested_date": m.requested_date.isoformat() if m.requested_date else None,
+                "actual_start": m.first_seen.isoformat() if m.first_seen else None,
+                "actual_end": m.last_seen.isoformat() if m.last_seen else None,
+                "crossover_detected": m.crossover_detected,
+                "files_scanned": m.files_scanned,
+                "records_extracted": m.records_extracted,
+                "extraction_time_seconds": round(m.extraction_time_seconds, 2),
             },
             "flight": {
-                "duration_minutes": round(self.metadata.duration_minutes, 1),
-                "first_position": self.metadata.first_position,
-                "last_position": self.metadata.last_position,
-                "max_altitude_ft": self.metadata.max_altitude_ft,
-                "min_altitude_ft": self.metadata.min_altitude_ft,
-                "max_ground_speed_kts": self.metadata.max_ground_speed_kts,
+                "duration_minutes": round(m.duration_minutes, 1),
+                "first_position": m.first_position,
+                "last_position": m.last_position,
+                "max_altitude_ft": m.max_altitude_ft,
+                "min_altitude_ft": m.min_altitude_ft,
+                "max_ground_speed_kts": m.max_ground_speed_kts,
             },
             "output_dir": str(self.output_dir) if self.output_dir else None,
         }
@@ -132,13 +137,7 @@ class FlightExtractor:
             metadata.actual_end_date = target_date
 
         # Collect all files
-        all_files = []
-        current = start_date
-        while current <= end_date:
-            all_files.extend(self.scanner.find_files_for_date(current))
-            current += timedelta(days=1)
-
-        all_files = sorted(set(all_files), key=lambda p: p.name)
+        all_files = self.scanner.find_files_for_range(start_date, end_date)
         metadata.files_scanned = len(all_files)
 
         log.info(f"Scanning {len(all_files)} files from {start_date} to {end_date}")
@@ -195,18 +194,21 @@ class FlightExtractor:
         if first_ts and last_ts:
             metadata.duration_minutes = (last_ts - first_ts) / 60.0
 
-        # Identity from first record with data
+        # Identity from first record with data (record key -> metadata field)
+        pending = {"hex": "hex_code", "r": "registration", "t": "aircraft_type", "ownOp": "operator"}
+        pending_keys = pending.keys()
         for r in records:
-            if not metadata.hex_code and r.get("hex"):
-                metadata.hex_code = r.get("hex", "").strip().lower()
-            if not metadata.registration and r.get("r"):
-                metadata.registration = r.get("r", "").strip()
-            if not metadata.aircraft_type and r.get("t"):
-                metadata.aircraft_type = r.get("t", "").strip()
-            if not metadata.operator and r.get("ownOp"):
-                metadata.operator = r.get("ownOp", "").strip()
-
-            if all([metadata.hex_code, metadata.registration, metadata.aircraft_type, metadata.operator]):
+            # Most records carry none of the still-missing fields
+            if pending_keys.isdisjoint(r.keys()):
+                continue
+
+            for key in [k for k in pending_keys if r.get(k)]:
+                value = r[key].strip()
+                setattr(metadata, pending[key], value.lower() if key == "hex" else value)
+                if value:
+                    del pending[key]
+
+            if not pending:
                 break
 
         # Position bounds
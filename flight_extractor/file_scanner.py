@@ -1,15 +1,108 @@
 """Efficient scanning of JSONL.gz log files for flight data."""
 import gzip
+import heapq
+import io
 import json
 import logging
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Generator, List, Optional, Set, Tuple
 
-from .config import Config, FILE_PREFIX, FILE_SUFFIX_GZ, FILE_SUFFIX_JSONL
+from .config import (
+    Config, FILE_PREFIX, FILE_SUFFIX_GZ, FILE_SUFFIX_JSONL, SCAN_INDEX_DIRNAME,
+    SCAN_INDEX_MAX_AGE_DAYS,
+)
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 log = logging.getLogger(__name__)
 
+# Read buffer for log files; much faster line iteration over gzip than the default
+LOG_READ_BUFFER = 1 << 20
+
+# Approximate bytes of log lines handled per batch when scanning a file
+SCAN_CHUNK_SIZE = 4 * LOG_READ_BUFFER
+
+# Threads used to list several days' directories at once (I/O bound)
+FILE_DISCOVERY_WORKERS = 4
+
+# Raw "flight"/"hex" string values, collected without parsing to build a scan index
+_FLIGHT_FIELD_RE = re.compile(rb'"flight"\s*:\s*"([^"]*)"')
+_HEX_FIELD_RE = re.compile(rb'"hex"\s*:\s*"([^"]*)"')
+
+
+def open_log(file_path: Path):
+    """Open a .jsonl or .jsonl.gz log file for iterating raw byte lines."""
+    if file_path.suffix == ".gz" or file_path.name.endswith(".jsonl.gz"):
+        return io.BufferedReader(gzip.open(file_path, "rb"), buffer_size=LOG_READ_BUFFER)
+    return open(file_path, "rb", buffering=LOG_READ_BUFFER)
+
+
+def _list_log_files(dir_path: Path) -> Tuple[str, ...]:
+    """
+    List the log file names in a directory, sorted by name.
+
+    Listings are cached until the directory's mtime changes, which happens
+    whenever a file is added, removed or renamed in it.
+    """
+    try:
+        mtime_ns = os.stat(dir_path).st_mtime_ns
+    except OSError:
+        return ()
+    return _list_log_files_cached(dir_path, mtime_ns)
+
+
+@lru_cache(maxsize=512)
+def _list_log_files_cached(dir_path: Path, mtime_ns: int) -> Tuple[str, ...]:
+    try:
+        with os.scandir(dir_path) as entries:
+            return tuple(sorted(
+                e.name for e in entries
+                if e.name.startswith(FILE_PREFIX)
+                and e.name.endswith((FILE_SUFFIX_GZ, FILE_SUFFIX_JSONL))
+            ))
+    except OSError:
+        return ()
+
+
+def parse_file_hour(file_path: Path) -> int:
+    """
+    Get the hour from a log file name such as adsb_state_2024-12-31_14.jsonl.gz.
+
+    Raises:
+        ValueError: If the name does not end in an hour
+    """
+    return int(file_path.name.split(".", 1)[0].rsplit("_", 1)[-1])
+
+
+def parse_line(line: bytes) -> dict:
+    """
+    Parse one raw JSONL line, using orjson when it is installed.
+
+    Lines that are not valid UTF-8 are decoded with replacement characters
+    and parsed by the stdlib, as reading the logs in text mode used to do.
+
+    Raises:
+        json.JSONDecodeError: If the line is not valid JSON
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line.decode("utf-8", errors="replace"))
+
 
 class FlightScanner:
     """Efficiently scan JSONL.gz files for specific flight data."""
@@ -17,6 +110,8 @@ class FlightScanner:
     def __init__(self, config: Optional[Config] = None):
         self.config = config or Config()
         self.log_dir = self.config.log_dir
+        self.index_dir = self.config.cache_dir / SCAN_INDEX_DIRNAME
+        self._index_pruned = False
 
     def find_files_for_date(self, target_date: date) -> List[Path]:
         """
@@ -25,24 +120,51 @@ class FlightScanner:
         Checks both organized structure (YYYY/MM/DD/) and flat structure.
         Returns files sorted by hour.
         """
-        files = []
-
         # Check organized structure: YYYY/MM/DD/
         organized_dir = self.log_dir / f"{target_date.year}" / f"{target_date.month:02d}" / f"{target_date.day:02d}"
-        if organized_dir.exists():
-            files.extend(organized_dir.glob(f"{FILE_PREFIX}*.jsonl.gz"))
-            files.extend(organized_dir.glob(f"{FILE_PREFIX}*.jsonl"))
+        organized = [organized_dir / name for name in _list_log_files(organized_dir)]
 
         # Also check flat structure (files not yet organized)
-        date_prefix = target_date.strftime("%Y-%m-%d")
-        files.extend(self.log_dir.glob(f"{FILE_PREFIX}{date_prefix}_*.jsonl.gz"))
-        files.extend(self.log_dir.glob(f"{FILE_PREFIX}{date_prefix}_*.jsonl"))
+        date_prefix = f"{FILE_PREFIX}{target_date.strftime('%Y-%m-%d')}_"
+        flat = [
+            self.log_dir / name
+            for name in _list_log_files(self.log_dir)
+            if name.startswith(date_prefix)
+        ]
+
+        # Both listings are sorted by filename (which sorts by hour)
+        if not flat:
+            return organized
+        if not organized:
+            return flat
+        return list(heapq.merge(organized, flat, key=lambda p: p.name))
+
+    def find_files_for_range(self, start_date: date, end_date: date) -> List[Path]:
+        """
+        Find all log files from start_date to end_date (inclusive).
 
-        # Remove duplicates and sort by filename (which sorts by hour)
-        unique_files = list(set(files))
-        unique_files.sort(key=lambda p: p.name)
+        Days are listed in parallel threads, since the globbing and stat
+        calls release the GIL. Each day's list is already sorted by
+        filename, so the days are merged rather than concatenated and
+        re-sorted.
+        """
+        days = []
+        current = start_date
+        while current <= end_date:
+            days.append(current)
+            current += timedelta(days=1)
 
-        return unique_files
+        if len(days) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(days), FILE_DISCOVERY_WORKERS)) as pool:
+                day_lists = list(pool.map(self.find_files_for_date, days))
+        else:
+            day_lists = [self.find_files_for_date(d) for d in days]
+
+        files = []
+        for path in heapq.merge(*day_lists, key=lambda p: p.name):
+            if not files or path != files[-1]:
+                files.append(path)
+        return files
 
     def find_files_for_hours(
         self,
@@ -57,11 +179,10 @@ class FlightScanner:
         for f in all_files:
             # Extract hour from filename: adsb_state_2024-12-31_14.jsonl.gz
             try:
-                hour_str = f.stem.replace(".jsonl", "").split("_")[-1]
-                hour = int(hour_str)
+                hour = parse_file_hour(f)
                 if start_hour <= hour <= end_hour:
                     filtered.append(f)
-            except (ValueError, IndexError):
+            except ValueError:
                 log.warning(f"Could not parse hour from filename: {f.name}")
                 continue
 
@@ -78,6 +199,9 @@ class FlightScanner:
 
         Uses streaming to minimize memory usage.
         Performs quick string check before JSON parsing for efficiency.
+        Completed .jsonl.gz files are skipped outright when their scan index
+        rules the flight out; a file without an index gets one built during
+        the first full pass over it.
         """
         if not file_path.exists():
             log.warning(f"File not found: {file_path}")
@@ -89,45 +213,173 @@ class FlightScanner:
 
         # Quick string to search for before parsing
         quick_check = search_callsign or search_hex
+        if quick_check:
+            quick_check = quick_check.lower().encode("utf-8")
+
+        index_key = self._index_key(file_path)
+        raw_flights = raw_hexes = None
+        if index_key is not None:
+            ids = self._load_file_index(file_path, index_key)
+            if ids is None:
+                raw_flights, raw_hexes = set(), set()  # Collect the index during this pass
+            elif (search_callsign and search_callsign not in ids) or (
+                search_hex and search_hex not in ids
+            ):
+                return
 
         try:
-            # Choose opener based on extension
-            if file_path.suffix == ".gz" or file_path.name.endswith(".jsonl.gz"):
-                opener = lambda: gzip.open(file_path, "rt", encoding="utf-8", errors="replace")
-            else:
-                opener = lambda: open(file_path, "r", encoding="utf-8", errors="replace")
-
-            with opener() as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    # Quick string check before parsing JSON
-                    if quick_check and quick_check.lower() not in line.lower():
-                        continue
-
-                    try:
-                        record = json.loads(line)
-                    except json.JSONDecodeError as e:
-                        log.debug(f"JSON parse error in {file_path.name}:{line_num}: {e}")
-                        continue
+            with open_log(file_path) as f:
+                lines_read = 0
+                while lines := f.readlines(SCAN_CHUNK_SIZE):
+                    first_line = lines_read + 1
+                    lines_read += len(lines)
+
+                    if raw_flights is not None:
+                        chunk = b"".join(lines)
+                        raw_flights.update(_FLIGHT_FIELD_RE.findall(chunk))
+                        raw_hexes.update(_HEX_FIELD_RE.findall(chunk))
+
+                    for line_num, line in enumerate(lines, first_line):
+                        line = line.strip()
+                        if not line:
+                            continue
 
-                    # Verify match
-                    if search_callsign:
-                        flight = (record.get("flight") or "").strip().upper()
-                        if flight != search_callsign:
+                        # Quick string check before parsing JSON
+                        if quick_check and quick_check not in line.lower():
                             continue
-                    if search_hex:
-                        hex_val = (record.get("hex") or "").strip().lower()
-                        if hex_val != search_hex:
+
+                        try:
+                            record = parse_line(line)
+                        except json.JSONDecodeError as e:
+                            log.debug(f"JSON parse error in {file_path.name}:{line_num}: {e}")
                             continue
 
-                    yield record
+                        # Verify match
+                        if search_callsign:
+                            flight = (record.get("flight") or "").strip().upper()
+                            if flight != search_callsign:
+                                continue
+                        if search_hex:
+                            hex_val = (record.get("hex") or "").strip().lower()
+                            if hex_val != search_hex:
+                                continue
+
+                        yield record
+
+            # Only a pass that reached the end of the file covers every record
+            if raw_flights is not None:
+                self._save_file_index(file_path, index_key, raw_flights, raw_hexes)
 
         except Exception as e:
             log.error(f"Error reading {file_path}: {e}")
 
+    def _index_key(self, file_path: Path) -> Optional[str]:
+        """Size/mtime key of a file's scan index, or None if it is not indexed."""
+        if not self.config.use_scan_index or not file_path.name.endswith(FILE_SUFFIX_GZ):
+            return None
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return f"{stat.st_size} {stat.st_mtime_ns}"
+
+    def _index_path(self, file_path: Path) -> Path:
+        return self.index_dir / f"{file_path.name}.ids"
+
+    def get_file_index(self, file_path: Path) -> Optional[Set[str]]:
+        """
+        Get the callsigns and hex codes that appear in a .jsonl.gz log file.
+
+        Callsigns are stripped and uppercased, hex codes stripped and
+        lowercased. Indexes are written by scan_file() and kept under the
+        cache directory, keyed on the log file's size and mtime so they
+        survive the file being moved into its date directory.
+
+        Args:
+            file_path: Log file to look up
+
+        Returns:
+            Set of identifiers, or None if the file has no current index
+        """
+        index_key = self._index_key(file_path)
+        if index_key is None:
+            return None
+        return self._load_file_index(file_path, index_key)
+
+    def _load_file_index(self, file_path: Path, index_key: str) -> Optional[Set[str]]:
+        try:
+            with open(self._index_path(file_path), encoding="utf-8") as f:
+                if f.readline().rstrip("\n") == index_key:
+                    return set(f.read().splitlines())
+        except OSError:
+            pass
+        return None
+
+    def _save_file_index(
+        self,
+        file_path: Path,
+        index_key: str,
+        raw_flights: Set[bytes],
+        raw_hexes: Set[bytes]
+    ):
+        """Normalize raw flight/hex values and write them as the file's index."""
+        if any(b"\\" in value for value in chain(raw_flights, raw_hexes)):
+            # Escaped strings need a real JSON parse; leave this file unindexed
+            return
+
+        ids = {value.decode("utf-8", errors="replace").strip().upper() for value in raw_flights}
+        ids.update(value.decode("utf-8", errors="replace").strip().lower() for value in raw_hexes)
+
+        index_path = self._index_path(file_path)
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp name so concurrent scanners never share a partial file
+            tmp = tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=index_path.parent,
+                prefix=f"{index_path.name}.", suffix=".tmp", delete=False
+            )
+            try:
+                with tmp:
+                    tmp.write("\n".join([index_key, *sorted(ids)]) + "\n")
+                os.replace(tmp.name, index_path)
+            except OSError:
+                Path(tmp.name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            log.debug(f"Could not write scan index {index_path}: {e}")
+            return
+
+        if not self._index_pruned:
+            self._index_pruned = True
+            self.prune_file_indexes()
+
+    def prune_file_indexes(self, max_age_days: int = SCAN_INDEX_MAX_AGE_DAYS) -> int:
+        """
+        Delete scan index files written more than max_age_days ago.
+
+        Called once per scanner after it writes its first index. Pruned
+        indexes are rebuilt by the next full scan of their log file.
+
+        Returns:
+            Number of index files deleted
+        """
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        try:
+            with os.scandir(self.index_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            removed += 1
+                    except OSError:
+                        continue
+        except OSError:
+            return 0
+        if removed:
+            log.debug(f"Pruned {removed} old scan index file(s)")
+        return removed
+
     def scan_files(
         self,
         files: List[Path],
@@ -179,14 +431,7 @@ class FlightScanner:
             end_date = start_date
 
         # Collect all files in date range
-        all_files = []
-        current = start_date
-        while current <= end_date:
-            all_files.extend(self.find_files_for_date(current))
-            current += timedelta(days=1)
-
-        # Remove duplicates and sort
-        all_files = sorted(set(all_files), key=lambda p: p.name)
+        all_files = self.find_files_for_range(start_date, end_date)
 
         log.info(f"Scanning {len(all_files)} files for {callsign}")
 
@@ -195,13 +440,19 @@ class FlightScanner:
     def get_unique_callsigns(
         self,
         target_date: date,
-        hours: Optional[Tuple[int, int]] = None
+        hours: Optional[Tuple[int, int]] = None,
+        prefix: Optional[str] = None
     ) -> Set[str]:
         """
         Get all unique callsigns seen on a date.
 
-        Useful for listing available flights.
+        Useful for listing available flights. If prefix is given, only
+        callsigns starting with it (case-insensitive) are returned, and
+        lines not containing it are skipped before JSON parsing.
         """
+        prefix = prefix.strip().upper() if prefix else None
+        prefix_bytes = prefix.encode("utf-8") if prefix else None
+
         if hours:
             files = self.find_files_for_hours(target_date, hours[0], hours[1])
         else:
@@ -211,19 +462,16 @@ class FlightScanner:
 
         for file_path in files:
             try:
-                if file_path.suffix == ".gz" or file_path.name.endswith(".jsonl.gz"):
-                    opener = lambda p=file_path: gzip.open(p, "rt", encoding="utf-8")
-                else:
-                    opener = lambda p=file_path: open(p, "r", encoding="utf-8")
-
-                with opener() as f:
+                with open_log(file_path) as f:
                     for line in f:
-                        if '"flight"' not in line:
+                        if b'"flight"' not in line:
+                            continue
+                        if prefix_bytes and prefix_bytes not in line.upper():
                             continue
                         try:
-                            record = json.loads(line)
+                            record = parse_line(line)
                             flight = (record.get("flight") or "").strip()
-                            if flight:
+                            if flight and (not prefix or flight.upper().startswith(prefix)):
                                 callsigns.add(flight)
                         except json.JSONDecodeError:
                             continue
@@ -246,7 +494,41 @@ class FlightScanner:
             files = self.find_files_for_date(target_date)
 
         for file_path in files:
-            for _ in self.scan_file(file_path, callsign=callsign):
+            if self.contains_callsign(file_path, callsign):
                 return True  # Found at least one record
 
         return False
+
+    def contains_callsign(self, file_path: Path, callsign: str) -> bool:
+        """
+        Check whether a log file has any record with the given callsign.
+
+        Answers from the file's scan index when there is one, otherwise
+        matches the "flight" field in the raw bytes without parsing JSON.
+        """
+        search_callsign = callsign.strip().upper()
+        if not search_callsign:
+            return any(True for _ in self.scan_file(file_path))
+
+        ids = self.get_file_index(file_path)
+        if ids is not None:
+            if search_callsign not in ids:
+                return False
+            # The index also holds lowercased hex codes, so a callsign with no
+            # letters could be a hex code; only trust it for the others
+            if search_callsign != search_callsign.lower():
+                return True
+
+        needle = search_callsign.encode("utf-8")
+        quick_check = needle.lower()
+        pattern = re.compile(rb'"flight"\s*:\s*"\s*' + re.escape(needle) + rb'\s*"', re.IGNORECASE)
+        try:
+            with open_log(file_path) as f:
+                while chunk := f.read(SCAN_CHUNK_SIZE):
+                    chunk += f.readline()
+                    if quick_check in chunk.lower() and pattern.search(chunk):
+                        return True
+        except Exception as e:
+            log.error(f"Error reading {file_path}: {e}")
+
+        return False
@@ -1,10 +1,11 @@
 """Handle flights that cross midnight boundaries."""
 import logging
 from datetime import date, datetime, timedelta, timezone
-from typing import List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from .config import Config
-from .file_scanner import FlightScanner
+from .file_scanner import FlightScanner, parse_file_hour
 
 log = logging.getLogger(__name__)
 
@@ -27,6 +28,9 @@ class MidnightCrossoverHandler:
         self.max_crossover_hours = self.config.max_crossover_hours
         self.midnight_window = self.config.midnight_window_hours
 
+        # (hour, file) pairs per date, reused within one detect_crossover call
+        self._hour_cache: Dict[date, List[Tuple[int, Path]]] = {}
+
     def detect_crossover(
         self,
         callsign: str,
@@ -49,6 +53,7 @@ class MidnightCrossoverHandler:
             Tuple of (start_date, end_date) - may be same date if no crossover
         """
         log.info(f"Checking midnight crossover for {callsign} on {primary_date}")
+        self._hour_cache.clear()
 
         start_date = primary_date
         end_date = primary_date
@@ -66,10 +71,21 @@ class MidnightCrossoverHandler:
 
         return (start_date, end_date)
 
+    def _files_for_hours(self, target_date: date, start_hour: int, end_hour: int) -> List[Path]:
+        """Find log files for specific hours, listing each date only once per detection."""
+        hour_files = self._hour_cache.get(target_date)
+        if hour_files is None:
+            hour_files = [
+                (parse_file_hour(f), f)
+                for f in self.scanner.find_files_for_hours(target_date)
+            ]
+            self._hour_cache[target_date] = hour_files
+        return [f for hour, f in hour_files if start_hour <= hour <= end_hour]
+
     def _check_forward_crossover(self, callsign: str, primary_date: date) -> date:
         """Check if flight continues past midnight into the next day."""
         # Get records from end of primary date (last 3 hours)
-        evening_files = self.scanner.find_files_for_hours(
+        evening_files = self._files_for_hours(
             primary_date,
             start_hour=24 - self.midnight_window,
             end_hour=23
@@ -105,7 +121,7 @@ class MidnightCrossoverHandler:
     def _check_backward_crossover(self, callsign: str, primary_date: date) -> date:
         """Check if flight started on the previous day."""
         # Get records from start of primary date (first 3 hours)
-        morning_files = self.scanner.find_files_for_hours(
+        morning_files = self._files_for_hours(
             primary_date,
             start_hour=0,
             end_hour=self.midnight_window - 1
@@ -157,7 +173,7 @@ class MidnightCrossoverHandler:
             if hour == 0 and hours_checked > 0:
                 current_date += timedelta(days=1)
 
-            files = self.scanner.find_files_for_hours(current_date, hour, hour)
+            files = self._files_for_hours(current_date, hour, hour)
 
             if not files:
                 hours_checked += 1
@@ -202,7 +218,7 @@ class MidnightCrossoverHandler:
             if hour == 23 and hours_checked > 0:
                 current_date -= timedelta(days=1)
 
-            files = self.scanner.find_files_for_hours(current_date, hour, hour)
+            files = self._files_for_hours(current_date, hour, hour)
 
             if not files:
                 hours_checked += 1
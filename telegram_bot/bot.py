@@ -534,12 +534,14 @@ class FlightBot:
         )
 
         # Generate charts (PNG only for Telegram)
+        figures = {}
         generate_all_charts(
             records=flight_data.records,
             callsign=callsign,
             output_dir=output_dir,
             generate_png=True,
-            generate_html=True
+            generate_html=True,
+            figure_cache=figures
         )
 
         # Generate dashboard
@@ -553,7 +555,8 @@ class FlightBot:
                 "duration_minutes": flight_data.metadata.duration_minutes,
                 "max_altitude_ft": flight_data.metadata.max_altitude_ft,
                 "records_extracted": flight_data.metadata.records_extracted,
-            }
+            },
+            prebuilt=figures
         )
 
         return flight_data
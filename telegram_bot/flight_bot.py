@@ -354,12 +354,14 @@ class FlightExtractionBot:
         )
 
         # Generate charts (PNG only for Telegram)
+        figures = {}
         generate_all_charts(
             records=flight_data.records,
             callsign=callsign,
             output_dir=output_dir,
             generate_png=True,
-            generate_html=True
+            generate_html=True,
+            figure_cache=figures
         )
 
         # Generate dashboard
@@ -373,7 +375,8 @@ class FlightExtractionBot:
                 "duration_minutes": flight_data.metadata.duration_minutes,
                 "max_altitude_ft": flight_data.metadata.max_altitude_ft,
                 "records_extracted": flight_data.metadata.records_extracted,
-            }
+            },
+            prebuilt=figures
         )
 
         return flight_data
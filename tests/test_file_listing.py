@@ -0,0 +1,90 @@
+"""Tests for finding hourly log files in the flat and organized layouts."""
+import os
+from datetime import date
+
+import pytest
+
+from flight_extractor.config import Config
+from flight_extractor.file_scanner import FlightScanner
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    return path
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    return tmp_path / "logs"
+
+
+@pytest.fixture
+def scanner(log_dir, tmp_path):
+    return FlightScanner(Config(log_dir=log_dir, cache_dir=tmp_path / "cache"))
+
+
+def _names(paths, log_dir):
+    return [p.relative_to(log_dir).as_posix() for p in paths]
+
+
+def test_merges_flat_and_organized_files_by_hour(scanner, log_dir):
+    day = log_dir / "2025" / "01" / "01"
+    for name in ["adsb_state_2025-01-01_00.jsonl.gz", "adsb_state_2025-01-01_02.jsonl.gz"]:
+        _touch(day / name)
+    for name in ["adsb_state_2025-01-01_01.jsonl.gz", "adsb_state_2025-01-01_03.jsonl",
+                 "adsb_state_2025-01-02_00.jsonl.gz", "other.jsonl.gz"]:
+        _touch(log_dir / name)
+
+    assert _names(scanner.find_files_for_date(date(2025, 1, 1)), log_dir) == [
+        "2025/01/01/adsb_state_2025-01-01_00.jsonl.gz",
+        "adsb_state_2025-01-01_01.jsonl.gz",
+        "2025/01/01/adsb_state_2025-01-01_02.jsonl.gz",
+        "adsb_state_2025-01-01_03.jsonl",
+    ]
+
+
+def test_file_in_both_layouts_is_listed_from_both(scanner, log_dir):
+    name = "adsb_state_2025-01-01_05.jsonl.gz"
+    _touch(log_dir / "2025" / "01" / "01" / name)
+    _touch(log_dir / name)
+
+    assert _names(scanner.find_files_for_date(date(2025, 1, 1)), log_dir) == [
+        f"2025/01/01/{name}",
+        name,
+    ]
+
+
+def test_single_layout_and_missing_day(scanner, log_dir):
+    _touch(log_dir / "adsb_state_2025-01-01_07.jsonl")
+
+    assert _names(scanner.find_files_for_date(date(2025, 1, 1)), log_dir) == [
+        "adsb_state_2025-01-01_07.jsonl",
+    ]
+    assert scanner.find_files_for_date(date(2025, 1, 9)) == []
+
+
+def test_listing_refreshes_when_directory_changes(scanner, log_dir):
+    _touch(log_dir / "adsb_state_2025-01-01_07.jsonl")
+    os.utime(log_dir, ns=(0, 1_000_000_000))
+    assert len(scanner.find_files_for_date(date(2025, 1, 1))) == 1
+
+    _touch(log_dir / "adsb_state_2025-01-01_08.jsonl")
+    os.utime(log_dir, ns=(0, 2_000_000_000))
+    assert len(scanner.find_files_for_date(date(2025, 1, 1))) == 2
+
+
+def test_range_merges_days_in_order(scanner, log_dir):
+    _touch(log_dir / "2024" / "12" / "31" / "adsb_state_2024-12-31_23.jsonl.gz")
+    _touch(log_dir / "2025" / "01" / "01" / "adsb_state_2025-01-01_00.jsonl.gz")
+    _touch(log_dir / "adsb_state_2025-01-01_01.jsonl")
+    _touch(log_dir / "adsb_state_2025-01-02_00.jsonl")
+
+    files = scanner.find_files_for_range(date(2024, 12, 31), date(2025, 1, 2))
+
+    assert [p.name for p in files] == [
+        "adsb_state_2024-12-31_23.jsonl.gz",
+        "adsb_state_2025-01-01_00.jsonl.gz",
+        "adsb_state_2025-01-01_01.jsonl",
+        "adsb_state_2025-01-02_00.jsonl",
+    ]
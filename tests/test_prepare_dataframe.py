@@ -0,0 +1,65 @@
+"""Tests for chart DataFrame preparation and flight phase detection."""
+import math
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from flight_charts.base import prepare_dataframe
+from flight_charts.phase_chart import detect_flight_phases, get_phase_summary
+
+
+def _flight_records():
+    """Taxi, climb to FL300, cruise, descend to 1000 ft, then roll out on the ground."""
+    records = []
+
+    def add(alt, rate, gs):
+        records.append({"_ts": 1735689600 + 10 * len(records), "alt_baro": alt,
+                        "baro_rate": rate, "gs": gs})
+
+    for _ in range(60):
+        add("ground", 0, 10)
+    for i in range(150):
+        add(200 * (i + 1), 1200, 300)
+    for _ in range(200):
+        add(30000, 0, 450)
+    for i in range(145):
+        add(30000 - 200 * (i + 1), -1200, 300)
+    for _ in range(60):
+        add("ground", 0, 10)
+    return records
+
+
+def test_ground_altitude_becomes_zero():
+    df = prepare_dataframe([
+        {"_ts": 0, "alt_baro": "ground", "alt_geom": "ground", "gs": "ground"},
+        {"_ts": 1, "alt_baro": 1200, "alt_geom": None, "gs": 140.5},
+    ])
+
+    assert df["alt_baro"].tolist() == [0.0, 1200.0]
+    assert df["alt_geom"].iloc[0] == 0.0
+    assert math.isnan(df["alt_geom"].iloc[1])
+    # Only altitude columns treat "ground" as a value
+    assert math.isnan(df["gs"].iloc[0])
+    assert df["gs"].iloc[1] == 140.5
+
+
+def test_unparseable_altitude_is_nan():
+    df = prepare_dataframe([{"_ts": 0, "alt_baro": "n/a"}, {"_ts": 1, "alt_baro": "3500"}])
+
+    assert math.isnan(df["alt_baro"].iloc[0])
+    assert df["alt_baro"].iloc[1] == 3500.0
+
+
+def test_phases_for_ground_climb_cruise_descent():
+    df = prepare_dataframe(_flight_records())
+    phases = detect_flight_phases(df)
+    summary = get_phase_summary(phases, df)
+
+    assert [s["phase"] for s in summary] == [
+        "ground", "takeoff", "climb", "cruise", "descent", "approach", "ground",
+    ]
+    # The roll-out after touchdown reports "ground", which is classified as
+    # altitude 0 rather than carried forward from the last airborne fix
+    assert summary[-1]["start_alt"] == 0.0
+    assert summary[-1]["duration_min"] == pytest.approx(9.5, abs=0.5)
@@ -0,0 +1,123 @@
+"""Tests for the per-file callsign/hex scan index."""
+import gzip
+import json
+import os
+
+import pytest
+
+from flight_extractor import file_scanner
+from flight_extractor.config import Config
+from flight_extractor.file_scanner import FlightScanner
+
+
+def _write_log(path, records):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    return path
+
+
+@pytest.fixture
+def scanner(tmp_path):
+    return FlightScanner(Config(log_dir=tmp_path / "logs", cache_dir=tmp_path / "cache"))
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    (tmp_path / "logs").mkdir()
+    return _write_log(tmp_path / "logs" / "adsb_state_2025-01-01_10.jsonl.gz", [
+        {"_ts": 1, "hex": "896180", "flight": "FDB1    "},
+        {"_ts": 2, "hex": "A6B7C8", "flight": "uae197"},
+        {"_ts": 3, "hex": "896180", "flight": "FDB1    "},
+        {"_ts": 4, "hex": "123456"},
+    ])
+
+
+def test_full_scan_writes_index(scanner, log_file):
+    assert scanner.get_file_index(log_file) is None
+
+    records = list(scanner.scan_file(log_file, callsign="fdb1"))
+
+    assert [r["_ts"] for r in records] == [1, 3]
+    assert scanner.get_file_index(log_file) == {"FDB1", "UAE197", "896180", "a6b7c8", "123456"}
+    assert [p.name for p in scanner.index_dir.iterdir()] == [f"{log_file.name}.ids"]
+
+
+def test_index_skips_file_without_flight(scanner, log_file, monkeypatch):
+    list(scanner.scan_file(log_file))
+
+    def fail(_):
+        raise AssertionError("file should not be opened")
+
+    monkeypatch.setattr(file_scanner, "open_log", fail)
+    assert list(scanner.scan_file(log_file, callsign="NOPE1")) == []
+    assert list(scanner.scan_file(log_file, hex_code="abcdef")) == []
+
+
+def test_indexed_scan_matches_unindexed(scanner, log_file, tmp_path):
+    plain = FlightScanner(Config(log_dir=tmp_path / "logs", cache_dir=tmp_path / "cache",
+                                 use_scan_index=False))
+    list(scanner.scan_file(log_file))
+
+    for callsign, hex_code in [("FDB1", None), ("UAE197", None), (None, "A6B7C8"),
+                               ("FDB1", "a6b7c8"), ("FDB12", None)]:
+        assert (list(scanner.scan_file(log_file, callsign, hex_code))
+                == list(plain.scan_file(log_file, callsign, hex_code)))
+
+
+def test_partial_scan_does_not_write_index(scanner, log_file):
+    records = scanner.scan_file(log_file, callsign="FDB1")
+    next(records)
+    records.close()
+
+    assert scanner.get_file_index(log_file) is None
+
+
+def test_changed_file_invalidates_index(scanner, log_file):
+    list(scanner.scan_file(log_file))
+    _write_log(log_file, [{"_ts": 5, "hex": "abcdef", "flight": "NEW1"}])
+    os.utime(log_file, ns=(0, 0))
+
+    assert scanner.get_file_index(log_file) is None
+    assert [r["_ts"] for r in scanner.scan_file(log_file, callsign="NEW1")] == [5]
+
+
+def test_escaped_values_are_not_indexed(scanner, tmp_path):
+    (tmp_path / "logs").mkdir()
+    path = tmp_path / "logs" / "adsb_state_2025-01-01_11.jsonl.gz"
+    path.write_bytes(gzip.compress(b'{"_ts": 1, "hex": "896180", "flight": "FDB\\u0031"}\n'))
+
+    # The raw bytes do not hold the decoded callsign, so no index is written
+    assert [r["flight"] for r in scanner.scan_file(path)] == ["FDB1"]
+    assert scanner.get_file_index(path) is None
+
+
+def test_plain_jsonl_is_never_indexed(scanner, tmp_path):
+    (tmp_path / "logs").mkdir()
+    path = tmp_path / "logs" / "adsb_state_2025-01-01_12.jsonl"
+    path.write_text('{"_ts": 1, "hex": "896180", "flight": "FDB1"}\n', encoding="utf-8")
+
+    assert len(list(scanner.scan_file(path, callsign="FDB1"))) == 1
+    assert not (scanner.index_dir).exists()
+
+
+def test_contains_callsign(scanner, log_file):
+    for indexed in (False, True):
+        assert scanner.contains_callsign(log_file, "fdb1")
+        assert scanner.contains_callsign(log_file, " UAE197 ")
+        assert not scanner.contains_callsign(log_file, "FDB")
+        # A hex code is not a callsign, with or without the index
+        assert not scanner.contains_callsign(log_file, "123456")
+        if not indexed:
+            list(scanner.scan_file(log_file))
+            assert scanner.get_file_index(log_file) is not None
+
+
+def test_prune_removes_old_indexes(scanner, log_file):
+    list(scanner.scan_file(log_file))
+    index_path = next(scanner.index_dir.iterdir())
+
+    assert scanner.prune_file_indexes() == 0
+    os.utime(index_path, (0, 0))
+    assert scanner.prune_file_indexes() == 1
+    assert scanner.get_file_index(log_file) is None